@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from typing import Optional
+import os
+import re
+from typing import AsyncIterator, Optional, Tuple
 from uuid import UUID, uuid4
-import base64
+import binascii
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, WebSocket, WebSocketDisconnect, status
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+try:  # Listed in requirements.txt; only needed for ?encoding=msgpack.
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - depends on optional lib
+    msgpack = None
 
 from src.backend.config import settings
 from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.services.conversation.service import conversation_service
 from src.backend.services.transcription.service import transcription_service
+from src.backend.services.transcription.streaming import LiveTranscriptBuffer
 from src.backend.services.encounters.service import encounter_service
 from src.backend.infra.storage.audio import audio_storage_backend
 from src.backend.services.audit.service import audit_service
@@ -23,6 +32,28 @@ router = APIRouter(
     dependencies=[Depends(get_api_key), Depends(tenant_dependency)],
 )
 
+# Uploads are read and persisted in chunks of this size so that peak memory per
+# request stays bounded regardless of the uploaded file size.
+_UPLOAD_CHUNK_BYTES = 1 << 20
+
+# Characters allowed in stored upload names; anything else becomes "_".
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+# Text frames carrying base64-encoded audio start with this marker.
+_AUDIO_BASE64_PREFIX = "AUDIO_BASE64:"
+_AUDIO_BASE64_PREFIX_LEN = len(_AUDIO_BASE64_PREFIX)
+
+
+def _upload_name(filename: Optional[str]) -> str:
+    """Return a unique storage name that keeps the client's file name.
+
+    Only the base name is kept and unusual characters are replaced, so the
+    result is always a plain file name inside the upload directory.
+    """
+
+    base = _UNSAFE_NAME_CHARS.sub("_", os.path.basename((filename or "").replace("\\", "/")))
+    return f"{uuid4().hex}-{base}" if base.strip("._") else uuid4().hex
+
 
 class IngestAudioResponse(BaseModel):
     job: TranscriptJob
@@ -46,8 +77,6 @@ async def upload_audio(
     path is used as the job's audio_url.
     """
 
-    suffix = (Path(file.filename).suffix or "").lstrip(".")
-
     # Basic content-type sanity check for uploaded files.
     if file.content_type and not file.content_type.startswith("audio/"):
         raise HTTPException(
@@ -55,47 +84,62 @@ async def upload_audio(
             detail="Invalid file type; expected audio/*.",
         )
 
-    content = await file.read()
-    if len(content) > settings.max_upload_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="Uploaded file too large.",
-        )
+    size_bytes = 0
+
+    async def _read_chunks() -> AsyncIterator[bytes]:
+        # Track the running size so the 413 fires as soon as the limit is
+        # crossed, without ever holding the whole payload in memory.
+        nonlocal size_bytes
+        while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+            size_bytes += len(chunk)
+            if size_bytes > settings.max_upload_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="Uploaded file too large.",
+                )
+            yield chunk
 
-    dest_ref = audio_storage_backend.save_file(content, suffix=f"{uuid4()}.{suffix}" if suffix else f"{uuid4()}" )
+    dest_ref = await audio_storage_backend.save_stream(_read_chunks(), suffix=_upload_name(file.filename))
 
-    job = transcription_service.create_job(
+    # ASR runs synchronously inside create_job; keep it off the event loop so
+    # other requests are served while this upload is transcribed.
+    job = await run_in_threadpool(
+        transcription_service.create_job,
         audio_url=str(dest_ref),
         language_code=language_code,
         target_language=target_language,
     )
 
-    attached_session_id: Optional[str] = None
-    attached_encounter_id: Optional[UUID] = None
-
-    # Optionally attach this job to an existing conversation session.
-    if session_id is not None:
-        session = conversation_service.get_session(session_id)
-        if session is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-        conversation_service.attach_job(session_id=session_id, job_id=job.id)
-        attached_session_id = str(session_id)
-
-    # Optionally attach this job to an existing clinical encounter or create one.
-    if encounter_id is not None:
-        encounter = encounter_service.get_encounter(encounter_id)
-        if encounter is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
-        encounter_service.attach_job(encounter_id=encounter_id, job_id=job.id)
-        attached_encounter_id = encounter_id
-    else:
+    def _link_job() -> Tuple[Optional[str], UUID]:
+        attached_session_id: Optional[str] = None
+
+        # Optionally attach this job to an existing conversation session.
+        if session_id is not None:
+            session = conversation_service.get_session(session_id)
+            if session is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+            conversation_service.attach_job(session_id=session_id, job_id=job.id)
+            attached_session_id = str(session_id)
+
+        # Optionally attach this job to an existing clinical encounter or create one.
+        if encounter_id is not None:
+            encounter = encounter_service.get_encounter(encounter_id)
+            if encounter is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
+            encounter_service.attach_job(encounter_id=encounter_id, job_id=job.id)
+            return attached_session_id, encounter_id
+
         encounter = encounter_service.create_encounter(
             clinician_id=clinician_id,
             patient_id=patient_id,
             title=file.filename,
         )
         encounter_service.attach_job(encounter_id=encounter.id, job_id=job.id)
-        attached_encounter_id = encounter.id
+        return attached_session_id, encounter.id
+
+    # Session/encounter stores may be database-backed; run them in the
+    # threadpool as well.
+    attached_session_id, attached_encounter_id = await run_in_threadpool(_link_job)
 
     audit_service.log_event(
         action="upload_audio",
@@ -105,7 +149,7 @@ async def upload_audio(
             "session_id": attached_session_id,
             "encounter_id": str(attached_encounter_id) if attached_encounter_id else None,
             "filename": file.filename,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
         },
     )
 
@@ -117,10 +161,10 @@ async def live_transcription(websocket: WebSocket) -> None:
     """Prototype live audio ingestion endpoint using WebSocket.
 
     Clients send binary audio chunks; the server responds with incremental
-    "partial" transcripts. For now we buffer audio to a temporary file and
-    invoke the configured ASR backend (e.g., Whisper) on the buffered audio
-    whenever new data arrives. If ASR fails, we fall back to a byte-count
-    message.
+    "partial" transcripts. Audio is buffered to a temporary file and the
+    configured ASR backend (e.g., Whisper) is run, throttled, over the rolling
+    window of not-yet-committed audio (see :class:`LiveTranscriptBuffer`). If
+    ASR fails, we fall back to a byte-count message.
     """
 
     # Extract optional query parameters for language and session association.
@@ -136,104 +180,137 @@ async def live_transcription(websocket: WebSocket) -> None:
             # Invalid session_id format; treat as no session.
             session_id = None
 
+    # Partial transcripts are JSON text frames by default. Clients may opt in
+    # to compact msgpack binary frames ({"p": partial_text, "n": total_bytes})
+    # with ?encoding=msgpack; error and final messages always stay JSON.
+    packb = None
+    if qp.get("encoding") == "msgpack":
+        if msgpack is None:  # pragma: no cover - depends on optional lib
+            await websocket.accept()
+            await websocket.send_json(
+                {"error": "msgpack encoding requires the 'msgpack' package on the server."}
+            )
+            await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+            return
+        packb = msgpack.packb
+
     await websocket.accept()
-    upload_dir = settings.audio_upload_dir
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    temp_path = upload_dir / f"ws-{uuid4()}.wav"
+    temp_path = settings.audio_upload_dir / f"ws-{uuid4()}.wav"
 
     total_bytes = 0
+    # open_append creates the upload directory if needed; keep that disk
+    # work off the event loop.
+    audio_out = await run_in_threadpool(
+        audio_storage_backend.open_append, str(temp_path), buffer_size=settings.ws_write_buffer_bytes
+    )
+    transcript_buffer = LiveTranscriptBuffer(
+        str(temp_path),
+        asr_backend=transcription_service._asr_backend,  # type: ignore[attr-defined]
+        language_code=language_code,
+    )
+
+    # Per-chunk hot path: bind everything looked up per frame once per
+    # connection (the ASR backend is already bound inside transcript_buffer).
+    max_ws_bytes = settings.max_ws_bytes
+    write_audio = audio_out.write
+    flush_audio = audio_out.flush
+    asr_due = transcript_buffer.due
+    asr_update = transcript_buffer.update
+    receive = websocket.receive
+
+    def _write_and_transcribe(chunk: bytes, n_bytes: int) -> str:
+        # Runs in the threadpool so the buffered write (which may spill to
+        # disk) and any flush happen off the event loop, in the same hop as
+        # the ASR update. Write errors propagate and end the stream; ASR
+        # errors are swallowed so the stream continues.
+        write_audio(chunk)
+        try:
+            if asr_due(n_bytes):
+                flush_audio()
+            return asr_update(n_bytes)
+        except Exception:  # pragma: no cover - defensive around external deps
+            return ""
+
+    async def _ingest_chunk(chunk: bytes) -> bool:
+        """Append ``chunk`` and send a partial transcript.
+
+        Returns False when the stream size limit was exceeded and the socket
+        has been closed.
+        """
+
+        nonlocal total_bytes
+        total_bytes += len(chunk)
+
+        # Enforce a maximum total stream size per connection.
+        if total_bytes > max_ws_bytes:
+            await websocket.send_json(
+                {
+                    "error": "Maximum stream size exceeded.",
+                    "total_bytes": total_bytes,
+                }
+            )
+            await websocket.close(code=1009)
+            return False
+
+        # Append chunk through the session-wide buffered handle. Writes are
+        # coalesced in userspace and only flushed when an ASR run is due.
+        # Only the uncommitted tail of the stream is re-transcribed, and runs
+        # are throttled, so cost stays linear in stream length.
+        transcript = await run_in_threadpool(_write_and_transcribe, chunk, total_bytes)
+
+        # Default partial text is a simple byte counter
+        partial_text = transcript or f"Received {total_bytes} bytes of audio (demo)"
+
+        if packb is not None:
+            await websocket.send_bytes(packb({"p": partial_text, "n": total_bytes}))
+        else:
+            await websocket.send_json(
+                {
+                    "partial_text": partial_text,
+                    "total_bytes": total_bytes,
+                }
+            )
+        return True
+
     try:
         while True:
-            message = await websocket.receive()
-            if "bytes" in message and message["bytes"] is not None:
-                chunk = message["bytes"]
-                total_bytes += len(chunk)
-
-                # Enforce a maximum total stream size per connection.
-                if total_bytes > settings.max_ws_bytes:
-                    await websocket.send_json(
-                        {
-                            "error": "Maximum stream size exceeded.",
-                            "total_bytes": total_bytes,
-                        }
-                    )
-                    await websocket.close(code=1009)
+            message = await receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            chunk = message.get("bytes")
+            if chunk is not None:
+                if not await _ingest_chunk(chunk):
                     break
-
-                # Append chunk to temp audio file
-                audio_storage_backend.append_file(str(temp_path), chunk)
-
-                # Default partial text is a simple byte counter
-                partial_text = f"Received {total_bytes} bytes of audio (demo)"
-
-                # Try to run ASR backend on the buffered audio for a richer
-                # partial transcript. Any errors are swallowed so the stream
-                # continues.
-                try:
-                    asr_backend = transcription_service._asr_backend  # type: ignore[attr-defined]
-                    transcript = asr_backend.transcribe(str(temp_path), language_code=language_code)
-                    if transcript:
-                        partial_text = transcript
-                except Exception:  # pragma: no cover - defensive around external deps
-                    pass
-
-                await websocket.send_json(
-                    {
-                        "partial_text": partial_text,
-                        "total_bytes": total_bytes,
-                    }
-                )
-            elif "text" in message and message["text"] is not None:
-                text_msg = message["text"]
+                continue
+            text_msg = message.get("text")
+            if text_msg is not None:
 
                 # Support base64-encoded audio chunks sent as text frames
                 # prefixed with "AUDIO_BASE64:". This is useful for mobile
                 # clients that find it easier to stream base64 text instead of
                 # raw binary WebSocket frames.
-                if text_msg.startswith("AUDIO_BASE64:"):
-                    b64_payload = text_msg[len("AUDIO_BASE64:") :]
+                if text_msg.startswith(_AUDIO_BASE64_PREFIX):
+                    # Decode straight from a view past the prefix so the
+                    # payload is not sliced into an intermediate string.
                     try:
-                        chunk = base64.b64decode(b64_payload)
-                    except Exception:
+                        chunk = binascii.a2b_base64(
+                            memoryview(text_msg.encode("ascii"))[_AUDIO_BASE64_PREFIX_LEN:]
+                        )
+                    except (binascii.Error, ValueError):
                         await websocket.send_json({"error": "Invalid base64 audio chunk"})
                         continue
 
-                    total_bytes += len(chunk)
-
-                    if total_bytes > settings.max_ws_bytes:
-                        await websocket.send_json(
-                            {
-                                "error": "Maximum stream size exceeded.",
-                                "total_bytes": total_bytes,
-                            }
-                        )
-                        await websocket.close(code=1009)
+                    if not await _ingest_chunk(chunk):
                         break
-
-                    audio_storage_backend.append_file(str(temp_path), chunk)
-
-                    partial_text = f"Received {total_bytes} bytes of audio (demo)"
-                    try:
-                        asr_backend = transcription_service._asr_backend  # type: ignore[attr-defined]
-                        transcript = asr_backend.transcribe(str(temp_path), language_code=language_code)
-                        if transcript:
-                            partial_text = transcript
-                    except Exception:  # pragma: no cover - defensive around external deps
-                        pass
-
-                    await websocket.send_json(
-                        {
-                            "partial_text": partial_text,
-                            "total_bytes": total_bytes,
-                        }
-                    )
                 # Allow clients to send a "stop" message to close the stream.
                 elif text_msg.lower() == "stop":
                     # On stop, optionally create a persisted transcription job
                     # from the buffered audio and attach it to a session.
                     job_payload = None
                     if total_bytes > 0:
-                        job = transcription_service.create_job(
+                        await run_in_threadpool(flush_audio)
+                        job = await run_in_threadpool(
+                            transcription_service.create_job,
                             audio_url=str(temp_path),
                             language_code=language_code,
                             target_language=target_language,
@@ -259,5 +336,6 @@ async def live_transcription(websocket: WebSocket) -> None:
         # Client disconnected; nothing else to do for this prototype.
         return
     finally:
+        audio_out.close()
         if temp_path.exists():
             audio_storage_backend.delete_file(str(temp_path))
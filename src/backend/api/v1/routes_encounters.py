@@ -6,21 +6,22 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
-from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
+from src.backend.domain.models.clinical_encounter import PRE_REVIEW_STATUSES, ClinicalEncounter, EncounterStatus
 from src.backend.domain.models.clinical_note import ClinicalNote
 from src.backend.domain.models.user import User
 from src.backend.domain.nlp.decision_support import DecisionSupportSuggestion
 from src.backend.domain.models.patient_metadata import PatientMetadata
+from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.services.transcription.service import transcription_service
-from src.backend.services.audit.service import audit_service
-from src.backend.services.nlp.service import nlp_service
+from src.backend.services.audit.service import EncounterAuditExtra, audit_service
+from src.backend.services.nlp.service import join_transcripts, nlp_service
 from src.backend.services.nlp.decision_support_service import decision_support_service
 from src.backend.security import get_api_key, get_current_user, ensure_can_view_encounter, ensure_can_edit_encounter
-from src.backend.infra.db.inmemory import (
-    encounter_repository,
-    clinical_note_repository,
-)
+# Looked up at call time: init_sql_repositories swaps these on startup.
+from src.backend.infra.db import inmemory as repos
+from src.backend.infra.db.session import unit_of_work
 from src.backend.services.encounters.service import encounter_service
 from src.backend.tenancy import tenant_dependency
 
@@ -32,6 +33,14 @@ router = APIRouter(
 )
 
 
+def _save_encounter_and_note(encounter: ClinicalEncounter, note: ClinicalNote) -> None:
+    # One session and transaction for both writes when SQL repositories are
+    # active.
+    with unit_of_work():
+        repos.encounter_repository.save(encounter)
+        repos.clinical_note_repository.save(note)
+
+
 class EncounterCreateRequest(BaseModel):
     patient_id: Optional[str] = None
     title: Optional[str] = None
@@ -48,7 +57,7 @@ class EncounterSummary(BaseModel):
 
 class EncounterDetailResponse(BaseModel):
     encounter: ClinicalEncounter
-    jobs: List[dict]
+    jobs: List[TranscriptJob]
     note: Optional[ClinicalNote] = None
 
 
@@ -67,6 +76,9 @@ class EncounterDecisionSupportRequest(BaseModel):
 
 class EncounterDecisionSupportResponse(BaseModel):
     suggestions: list[DecisionSupportSuggestion]
+    # True when the combined transcript exceeded MAX_NLP_CHARS and its end
+    # was not analyzed.
+    transcript_truncated: bool = False
 
 
 class EncounterRegulatedDecisionSupportResponse(BaseModel):
@@ -83,19 +95,20 @@ async def create_encounter(
     payload: EncounterCreateRequest,
     current_user: User = Depends(get_current_user),
 ) -> ClinicalEncounter:
+    user_id = str(current_user.id)
     encounter = encounter_service.create_encounter(
-        clinician_id=str(current_user.id),
+        clinician_id=user_id,
         patient_id=payload.patient_id,
         title=payload.title,
     )
     # Persist via repository abstraction for future DB-backed implementations.
-    encounter_repository.save(encounter)
+    repos.encounter_repository.save(encounter)
 
     audit_service.log_event(
         action="create_encounter",
         resource_type="clinical_encounter",
         resource_id=str(encounter.id),
-        extra={"user_id": str(current_user.id), "role": current_user.role.value},
+        extra=EncounterAuditExtra(user_id=user_id, role=current_user.role.value),
     )
 
     return encounter
@@ -106,25 +119,24 @@ async def get_encounter_detail(
     encounter_id: UUID,
     current_user: User = Depends(get_current_user),
 ) -> EncounterDetailResponse:
-    encounter = encounter_repository.get(encounter_id)
+    encounter = repos.encounter_repository.get(encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     ensure_can_view_encounter(current_user, encounter.clinician_id)
 
-    jobs = []
-    for job_id in encounter.transcription_job_ids:
-        job = transcription_service.get_job(job_id)
-        if job is not None:
-            jobs.append(job.model_dump())
+    # Pass the job models through as-is; FastAPI serializes the whole response
+    # in a single pydantic-core pass instead of dumping each job to a dict
+    # first.
+    jobs = transcription_service.get_jobs(encounter.transcription_job_ids)
 
-    note = clinical_note_repository.get_by_encounter(encounter_id)
+    note = repos.clinical_note_repository.get_by_encounter(encounter_id)
 
     audit_service.log_event(
         action="get_encounter",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={"user_id": str(current_user.id), "role": current_user.role.value},
+        extra=EncounterAuditExtra(user_id=str(current_user.id), role=current_user.role.value),
     )
 
     return EncounterDetailResponse(encounter=encounter, jobs=jobs, note=note)
@@ -137,30 +149,36 @@ async def list_encounters(
     own_only: bool = True,
     current_user: User = Depends(get_current_user),
 ) -> List[EncounterSummary]:
-    results: List[EncounterSummary] = []
+    user_id = str(current_user.id)
     # Use repository abstraction to list encounters matching optional filters.
-    encounters_iter = encounter_repository.list_by_filters(
-        clinician_id=str(current_user.id) if own_only and current_user.role != current_user.role.ADMIN else None,
+    # Only the summary columns are fetched, and since they come from our own
+    # repository they are already validated; skip per-item validation.
+    rows = repos.encounter_repository.list_summaries_by_filters(
+        clinician_id=user_id if own_only and current_user.role != current_user.role.ADMIN else None,
         patient_id=patient_id,
         status=status_filter,
     )
-    for encounter in encounters_iter:
-        results.append(
-            EncounterSummary(
-                id=encounter.id,
-                created_at=encounter.created_at,
-                clinician_id=encounter.clinician_id,
-                patient_id=encounter.patient_id,
-                status=encounter.status,
-                title=encounter.title,
-            )
+    results = [
+        EncounterSummary.model_construct(
+            id=r.id,
+            created_at=r.created_at,
+            clinician_id=r.clinician_id,
+            patient_id=r.patient_id,
+            status=r.status,
+            title=r.title,
         )
+        for r in rows
+    ]
 
     audit_service.log_event(
         action="list_encounters",
         resource_type="clinical_encounter",
         resource_id=None,
-        extra={"user_id": str(current_user.id), "role": current_user.role.value, "count": len(results)},
+        extra=EncounterAuditExtra(
+            user_id=user_id,
+            role=current_user.role.value,
+            count=len(results),
+        ),
     )
 
     return results
@@ -172,35 +190,37 @@ async def update_encounter_note(
     payload: EncounterNoteUpdateRequest,
     current_user: User = Depends(get_current_user),
 ) -> ClinicalNote:
-    encounter = encounter_repository.get(encounter_id)
+    user_id = str(current_user.id)
+    encounter = await run_in_threadpool(repos.encounter_repository.get, encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     ensure_can_edit_encounter(current_user, encounter.clinician_id)
 
-    note = encounter_service.upsert_note_from_soap(
+    note = await run_in_threadpool(
+        encounter_service.upsert_note_from_soap,
         encounter_id=encounter_id,
         subjective=payload.subjective,
         objective=payload.objective,
         assessment=payload.assessment,
         plan=payload.plan,
-        editor_id=str(current_user.id),
+        editor_id=user_id,
         finalize=payload.finalize,
     )
     # Persist updated encounter/note via repositories; the in-memory service
-    # already mutated its state, so we simply save current objects.
-    encounter_repository.save(encounter)
-    clinical_note_repository.save(note)
+    # already mutated its state, so we simply save current objects. Repository
+    # calls run in the threadpool since SQL-backed repositories block.
+    await run_in_threadpool(_save_encounter_and_note, encounter, note)
 
     audit_service.log_event(
         action="update_encounter_note",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={
-            "user_id": str(current_user.id),
-            "role": current_user.role.value,
-            "finalize": payload.finalize,
-        },
+        extra=EncounterAuditExtra(
+            user_id=user_id,
+            role=current_user.role.value,
+            finalize=payload.finalize,
+        ),
     )
 
     return note
@@ -211,25 +231,25 @@ async def submit_for_review(
     encounter_id: UUID,
     current_user: User = Depends(get_current_user),
 ) -> ClinicalEncounter:
-    encounter = encounter_repository.get(encounter_id)
+    encounter = await run_in_threadpool(repos.encounter_repository.get, encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     ensure_can_edit_encounter(current_user, encounter.clinician_id)
 
-    if encounter.status in {EncounterStatus.CREATED, EncounterStatus.IN_PROGRESS}:
+    if encounter.status in PRE_REVIEW_STATUSES:
         encounter.status = EncounterStatus.READY_FOR_REVIEW
-        encounter_repository.save(encounter)
+        await run_in_threadpool(repos.encounter_repository.save, encounter)
 
     audit_service.log_event(
         action="submit_encounter_for_review",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={
-            "user_id": str(current_user.id),
-            "role": current_user.role.value,
-            "status": encounter.status.value,
-        },
+        extra=EncounterAuditExtra(
+            user_id=str(current_user.id),
+            role=current_user.role.value,
+            status=encounter.status.value,
+        ),
     )
 
     return encounter
@@ -241,13 +261,14 @@ async def finalize_encounter(
     payload: EncounterFinalizeRequest,
     current_user: User = Depends(get_current_user),
 ) -> ClinicalNote:
-    encounter = encounter_repository.get(encounter_id)
+    user_id = str(current_user.id)
+    encounter = await run_in_threadpool(repos.encounter_repository.get, encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     ensure_can_edit_encounter(current_user, encounter.clinician_id)
 
-    note = clinical_note_repository.get_by_encounter(encounter_id)
+    note = await run_in_threadpool(repos.clinical_note_repository.get_by_encounter, encounter_id)
     if note is None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="No note available to finalize")
 
@@ -255,23 +276,18 @@ async def finalize_encounter(
 
     now = datetime.utcnow()
     note.is_finalized = True
-    note.reviewed_by = str(current_user.id)
+    note.reviewed_by = user_id
     note.reviewed_at = now
     note.review_comment = payload.review_comment
 
-    clinical_note_repository.save(note)
-
     encounter.status = EncounterStatus.FINALIZED
-    encounter_repository.save(encounter)
+    await run_in_threadpool(_save_encounter_and_note, encounter, note)
 
     audit_service.log_event(
         action="finalize_encounter",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={
-            "user_id": str(current_user.id),
-            "role": current_user.role.value,
-        },
+        extra=EncounterAuditExtra(user_id=user_id, role=current_user.role.value),
     )
 
     return note
@@ -289,17 +305,17 @@ async def encounter_decision_support(
     attached to the encounter using the demo NLP pipeline.
     """
 
-    encounter = encounter_repository.get(encounter_id)
+    encounter = repos.encounter_repository.get(encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     ensure_can_view_encounter(current_user, encounter.clinician_id)
 
-    texts: list[str] = []
-    for job_id in encounter.transcription_job_ids:
-        job = transcription_service.get_job(job_id)
-        if job and job.result_text:
-            texts.append(job.result_text)
+    texts: list[str] = [
+        job.result_text
+        for job in transcription_service.get_jobs(encounter.transcription_job_ids)
+        if job.result_text
+    ]
 
     if not texts:
         raise HTTPException(
@@ -307,12 +323,13 @@ async def encounter_decision_support(
             detail="No transcription results available for this encounter",
         )
 
-    combined = "\n\n".join(texts)
+    combined = join_transcripts(texts, source=f"encounter {encounter_id}")
     patient_metadata = (
         payload.patient_metadata.model_dump() if payload and payload.patient_metadata else None
     )
-    entities, soap = nlp_service.extract_and_summarize(
-        combined,
+    entities, soap = await run_in_threadpool(
+        nlp_service.extract_and_summarize,
+        combined.text,
         patient_metadata=patient_metadata,
     )
     suggestions = decision_support_service.suggest(
@@ -325,14 +342,14 @@ async def encounter_decision_support(
         action="encounter_decision_support",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={
-            "user_id": str(current_user.id),
-            "role": current_user.role.value,
-            "suggestion_count": len(suggestions),
-        },
+        extra=EncounterAuditExtra(
+            user_id=str(current_user.id),
+            role=current_user.role.value,
+            suggestion_count=len(suggestions),
+        ),
     )
 
-    return EncounterDecisionSupportResponse(suggestions=suggestions)
+    return EncounterDecisionSupportResponse(suggestions=suggestions, transcript_truncated=combined.truncated)
 
 
 @router.post("/{encounter_id}/decision-support/regulated", response_model=EncounterRegulatedDecisionSupportResponse)
@@ -346,7 +363,7 @@ async def encounter_decision_support_regulated(
     that regulated CDS is not active yet.
     """
 
-    encounter = encounter_repository.get(encounter_id)
+    encounter = repos.encounter_repository.get(encounter_id)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
@@ -356,11 +373,11 @@ async def encounter_decision_support_regulated(
         action="encounter_decision_support_regulated",
         resource_type="clinical_encounter",
         resource_id=str(encounter_id),
-        extra={
-            "user_id": str(current_user.id),
-            "role": current_user.role.value,
-            "enabled": False,
-        },
+        extra=EncounterAuditExtra(
+            user_id=str(current_user.id),
+            role=current_user.role.value,
+            enabled=False,
+        ),
     )
 
     return EncounterRegulatedDecisionSupportResponse(enabled=False, suggestions=[])
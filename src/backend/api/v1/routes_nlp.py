@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.domain.models.patient_metadata import PatientMetadata
 from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote
@@ -31,7 +32,10 @@ async def analyze_transcript(payload: AnalyzeRequest) -> AnalyzeResponse:
     """Run demo clinical NLP pipeline on a transcript string."""
 
     pm = payload.patient_metadata.model_dump() if payload.patient_metadata else None
-    entities, soap = nlp_service.extract_and_summarize(
+    # The NLP pipeline is CPU-bound; run it in the threadpool so the event
+    # loop keeps serving other requests meanwhile.
+    entities, soap = await run_in_threadpool(
+        nlp_service.extract_and_summarize,
         payload.transcript,
         patient_metadata=pm,
     )
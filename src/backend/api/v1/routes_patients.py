@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import List
 
 from fastapi import APIRouter, Depends
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.domain.models.patient_timeline import TimelineEvent
 from src.backend.security import get_api_key
@@ -19,4 +20,4 @@ router = APIRouter(
 
 @router.get("/{patient_id}/timeline", response_model=List[TimelineEvent])
 async def get_patient_timeline(patient_id: str) -> List[TimelineEvent]:
-    return patient_summary_service.build_timeline(patient_id)
+    return await run_in_threadpool(patient_summary_service.get_timeline, patient_id)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List, Optional, Set
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
 from src.backend.domain.models.clinical_note import ClinicalNote
+from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.domain.models.user import User
 from src.backend.services.encounters.service import encounter_service
-from src.backend.infra.db.inmemory import encounter_repository, clinical_note_repository
+# Looked up at call time: init_sql_repositories swaps these on startup.
+from src.backend.infra.db import inmemory as repos
+from src.backend.infra.db.session import unit_of_work
 from src.backend.services.transcription.service import transcription_service
 from src.backend.services.audit.service import audit_service
 from src.backend.security import (
@@ -40,7 +45,7 @@ class ScribeEncounterSummary(BaseModel):
 
 class ScribeEncounterDetail(BaseModel):
     encounter: ClinicalEncounter
-    jobs: List[dict]
+    jobs: List[TranscriptJob]
     note: ClinicalNote | None = None
 
 
@@ -51,6 +56,24 @@ class ScribeUpdateNoteRequest(BaseModel):
     plan: str
 
 
+def _iter_queue_summaries(with_notes: Set[UUID]) -> Iterator[ScribeEncounterSummary]:
+    """Yield queue rows for non-finalized encounters without a note."""
+
+    # Rows come from trusted domain models, so skip per-row validation.
+    for enc in repos.encounter_repository.list_by_filters(status_not=EncounterStatus.FINALIZED):
+        if enc.id in with_notes:
+            continue
+        yield ScribeEncounterSummary.model_construct(
+            id=enc.id,
+            created_at=enc.created_at_iso,
+            clinician_id=enc.clinician_id,
+            patient_id=enc.patient_id,
+            title=enc.title,
+            assigned_scribe_id=enc.assigned_scribe_id,
+            status=enc.status,
+        )
+
+
 @router.get("/queue", response_model=List[ScribeEncounterSummary])
 async def list_scribe_queue(
     current_user: User = Depends(get_current_user),
@@ -64,25 +87,12 @@ async def list_scribe_queue(
 
     ensure_is_scribe_or_admin(current_user)
 
-    summaries: List[ScribeEncounterSummary] = []
-    for enc in encounter_repository.list_by_filters():
-        if enc.status == EncounterStatus.FINALIZED:
-            continue
-        note = clinical_note_repository.get_by_encounter(enc.id)
-        if note is not None:
-            continue
+    # One lookup for all encounters that already have notes instead of a
+    # get_by_encounter call per encounter.
+    def _load_queue() -> List[ScribeEncounterSummary]:
+        return list(_iter_queue_summaries(repos.clinical_note_repository.encounter_ids_with_notes()))
 
-        summaries.append(
-            ScribeEncounterSummary(
-                id=enc.id,
-                created_at=enc.created_at.isoformat(),
-                clinician_id=enc.clinician_id,
-                patient_id=enc.patient_id,
-                title=enc.title,
-                assigned_scribe_id=enc.assigned_scribe_id,
-                status=enc.status,
-            )
-        )
+    summaries = await run_in_threadpool(_load_queue)
 
     audit_service.log_event(
         action="scribe_queue_list",
@@ -93,6 +103,42 @@ async def list_scribe_queue(
     return summaries
 
 
+@router.get("/queue/stream")
+async def stream_scribe_queue(
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream the scribe queue as newline-delimited JSON.
+
+    Same rows as ``GET /scribe/queue``, but each summary is written as soon as
+    it passes the filter so large queues are never held in memory as one
+    list or one JSON document.
+    """
+
+    ensure_is_scribe_or_admin(current_user)
+
+    with_notes = await run_in_threadpool(repos.clinical_note_repository.encounter_ids_with_notes)
+    user_id = str(current_user.id)
+
+    def _rows() -> Iterator[bytes]:
+        count = 0
+        completed = False
+        try:
+            for summary in _iter_queue_summaries(with_notes):
+                count += 1
+                yield summary.model_dump_json().encode() + b"\n"
+            completed = True
+        finally:
+            # Audit even when the client disconnects mid-stream (the generator
+            # is closed at a yield); ``count`` is the rows actually sent.
+            audit_service.log_event(
+                action="scribe_queue_stream",
+                resource_type="clinical_encounter",
+                extra={"user_id": user_id, "count": count, "completed": completed},
+            )
+
+    return StreamingResponse(_rows(), media_type="application/x-ndjson")
+
+
 @router.post("/queue/{encounter_id}/claim", response_model=ClinicalEncounter)
 async def claim_encounter_for_scribing(
     encounter_id: UUID,
@@ -105,14 +151,17 @@ async def claim_encounter_for_scribing(
 
     ensure_is_scribe_or_admin(current_user)
 
-    encounter = encounter_repository.get(encounter_id)
+    def _claim() -> Optional[ClinicalEncounter]:
+        encounter = repos.encounter_repository.get(encounter_id)
+        if encounter is not None and encounter.assigned_scribe_id is None:
+            encounter.assigned_scribe_id = str(current_user.id)
+            repos.encounter_repository.save(encounter)
+        return encounter
+
+    encounter = await run_in_threadpool(_claim)
     if encounter is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
-    if encounter.assigned_scribe_id is None:
-        encounter.assigned_scribe_id = str(current_user.id)
-        encounter_repository.save(encounter)
-
     audit_service.log_event(
         action="scribe_claim_encounter",
         resource_type="clinical_encounter",
@@ -132,17 +181,17 @@ async def get_scribe_encounter_detail(
 
     ensure_is_scribe_or_admin(current_user)
 
-    encounter = encounter_repository.get(encounter_id)
-    if encounter is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
+    def _load_detail() -> Optional[ScribeEncounterDetail]:
+        encounter = repos.encounter_repository.get(encounter_id)
+        if encounter is None:
+            return None
+        jobs = transcription_service.get_jobs(encounter.transcription_job_ids)
+        note = repos.clinical_note_repository.get_by_encounter(encounter_id)
+        return ScribeEncounterDetail(encounter=encounter, jobs=jobs, note=note)
 
-    jobs: List[dict] = []
-    for job_id in encounter.transcription_job_ids:
-        job = transcription_service.get_job(job_id)
-        if job is not None:
-            jobs.append(job.model_dump())
-
-    note = clinical_note_repository.get_by_encounter(encounter_id)
+    detail = await run_in_threadpool(_load_detail)
+    if detail is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     audit_service.log_event(
         action="scribe_get_encounter",
@@ -151,7 +200,7 @@ async def get_scribe_encounter_detail(
         extra={"user_id": str(current_user.id)},
     )
 
-    return ScribeEncounterDetail(encounter=encounter, jobs=jobs, note=note)
+    return detail
 
 
 @router.put("/encounters/{encounter_id}/note", response_model=ClinicalNote)
@@ -168,22 +217,33 @@ async def scribe_update_note(
 
     ensure_is_scribe_or_admin(current_user)
 
-    encounter = encounter_repository.get(encounter_id)
-    if encounter is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
+    def _update_note() -> Optional[ClinicalNote]:
+        encounter = repos.encounter_repository.get(encounter_id)
+        if encounter is None:
+            return None
+
+        status_before = encounter.status
+        note = encounter_service.upsert_note_from_soap(
+            encounter_id=encounter_id,
+            subjective=payload.subjective,
+            objective=payload.objective,
+            assessment=payload.assessment,
+            plan=payload.plan,
+            editor_id=str(current_user.id),
+            finalize=False,
+        )
 
-    note = encounter_service.upsert_note_from_soap(
-        encounter_id=encounter_id,
-        subjective=payload.subjective,
-        objective=payload.objective,
-        assessment=payload.assessment,
-        plan=payload.plan,
-        editor_id=str(current_user.id),
-        finalize=False,
-    )
+        # Scribe edits only touch the note; the encounter needs writing back
+        # only if the upsert advanced its status in place.
+        with unit_of_work():
+            if encounter.status != status_before:
+                repos.encounter_repository.save(encounter)
+            repos.clinical_note_repository.save(note)
+        return note
 
-    encounter_repository.save(encounter)
-    clinical_note_repository.save(note)
+    note = await run_in_threadpool(_update_note)
+    if note is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Encounter not found")
 
     audit_service.log_event(
         action="scribe_update_note",
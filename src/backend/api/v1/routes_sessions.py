@@ -11,10 +11,8 @@ from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote, Transcript
 from src.backend.domain.nlp.coding_models import CodeAssignment, BillingRiskSummary
 from src.backend.domain.models.transcription_job import TranscriptJobStatus
 from src.backend.services.conversation.service import conversation_service
-from src.backend.services.nlp.service import nlp_service
-from src.backend.services.nlp.coding_orchestrator import coding_orchestrator
-from src.backend.services.nlp.relevance_classifier import relevance_classifier
-from src.backend.services.nlp.emotion_classifier import emotion_classifier
+from src.backend.services.nlp.analysis import analyze_transcript_text
+from src.backend.services.nlp.service import join_transcripts
 from src.backend.services.transcription.service import transcription_service
 from src.backend.services.audit.service import audit_service
 from src.backend.security import get_api_key
@@ -41,6 +39,9 @@ class SessionAnalyzeResponse(BaseModel):
     codes: list[CodeAssignment] = []
     billing_risk: BillingRiskSummary | None = None
     segments: list[TranscriptSegment] = []
+    # True when the combined transcript exceeded MAX_NLP_CHARS and its end
+    # was not analyzed.
+    transcript_truncated: bool = False
 
 
 @router.post("/", response_model=ConversationSession, status_code=status.HTTP_201_CREATED)
@@ -105,11 +106,11 @@ async def analyze_session(session_id: UUID) -> SessionAnalyzeResponse:
     if session is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
-    texts = []
-    for job_id in session.transcription_job_ids:
-        job = transcription_service.get_job(job_id)
-        if job and job.status == TranscriptJobStatus.COMPLETED and job.result_text:
-            texts.append(job.result_text)
+    texts = [
+        job.result_text
+        for job in transcription_service.get_jobs(session.transcription_job_ids)
+        if job.status == TranscriptJobStatus.COMPLETED and job.result_text
+    ]
 
     if not texts:
         raise HTTPException(
@@ -117,11 +118,8 @@ async def analyze_session(session_id: UUID) -> SessionAnalyzeResponse:
             detail="No completed transcription results available for this session",
         )
 
-    combined = "\n\n".join(texts)
-    entities, soap = nlp_service.extract_and_summarize(combined)
-    codes, billing_risk = coding_orchestrator.assign_codes(entities, soap)
-    segments = relevance_classifier.classify_segments(combined)
-    segments = emotion_classifier.classify_segments(segments)
+    combined = join_transcripts(texts, source=f"session {session_id}")
+    entities, soap, codes, billing_risk, segments = await analyze_transcript_text(combined.text)
 
     audit_service.log_event(
         action="analyze_session",
@@ -132,6 +130,7 @@ async def analyze_session(session_id: UUID) -> SessionAnalyzeResponse:
             "has_codes": bool(codes),
             "billing_risk_level": billing_risk.level.value if billing_risk else None,
             "segment_count": len(segments),
+            "transcript_truncated": combined.truncated,
         },
     )
 
@@ -141,4 +140,5 @@ async def analyze_session(session_id: UUID) -> SessionAnalyzeResponse:
         codes=codes,
         billing_risk=billing_risk,
         segments=segments,
+        transcript_truncated=combined.truncated,
     )
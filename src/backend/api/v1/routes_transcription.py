@@ -3,18 +3,18 @@ from __future__ import annotations
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, HttpUrl
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.services.transcription.service import transcription_service
+from src.backend.services.nlp.analysis import analyze_transcript_text
 from src.backend.services.nlp.service import nlp_service
 from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote
 from src.backend.domain.nlp.coding_models import CodeAssignment, BillingRiskSummary
 from src.backend.domain.nlp.models import TranscriptSegment
-from src.backend.services.nlp.coding_orchestrator import coding_orchestrator
-from src.backend.services.nlp.relevance_classifier import relevance_classifier
-from src.backend.services.nlp.emotion_classifier import emotion_classifier
 from src.backend.services.ehr.service import demo_fhir_exporter
 from src.backend.services.encounters.service import encounter_service
 from src.backend.services.audit.service import audit_service
@@ -43,7 +43,9 @@ async def create_transcription(request: CreateTranscriptionRequest) -> Transcrip
     processing.
     """
 
-    job = transcription_service.create_job(
+    # ASR runs synchronously inside create_job; keep it off the event loop.
+    job = await run_in_threadpool(
+        transcription_service.create_job,
         audio_url=str(request.audio_url),
         language_code=request.language_code,
         target_language=request.target_language,
@@ -99,14 +101,11 @@ async def analyze_transcription(job_id: UUID) -> AnalyzeTranscriptionResponse:
     if not job.result_text:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Transcription result not available yet")
 
-    entities, soap = nlp_service.extract_and_summarize(job.result_text)
-    codes, billing_risk = coding_orchestrator.assign_codes(entities, soap)
-    segments = relevance_classifier.classify_segments(job.result_text)
-    segments = emotion_classifier.classify_segments(segments)
+    entities, soap, codes, billing_risk, segments = await analyze_transcript_text(job.result_text)
 
     # Best-effort: attach or update a clinical note for any encounter that
     # already references this transcription job.
-    try:
+    def _attach_note() -> None:
         encounter = encounter_service.find_encounter_for_job(job_id)
         if encounter is not None:
             encounter_service.upsert_note_from_soap(
@@ -118,6 +117,9 @@ async def analyze_transcription(job_id: UUID) -> AnalyzeTranscriptionResponse:
                 editor_id=None,
                 finalize=False,
             )
+
+    try:
+        await run_in_threadpool(_attach_note)
     except Exception:  # pragma: no cover - defensive around early wiring
         pass
 
@@ -142,7 +144,7 @@ async def analyze_transcription(job_id: UUID) -> AnalyzeTranscriptionResponse:
 
 
 @router.post("/{job_id}/export/fhir", response_model=FHIRExportResponse)
-async def export_transcription_fhir(job_id: UUID) -> FHIRExportResponse:
+async def export_transcription_fhir(job_id: UUID) -> Response:
     """Export a completed transcription job as a demo FHIR Bundle.
 
     This reuses the NLP pipeline internally, then maps the results into a
@@ -155,14 +157,20 @@ async def export_transcription_fhir(job_id: UUID) -> FHIRExportResponse:
     if not job.result_text:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Transcription result not available yet")
 
-    entities, soap = nlp_service.extract_and_summarize(job.result_text)
-    bundle = demo_fhir_exporter.build_fhir_bundle(job_id=job_id, entities=entities, soap_note=soap)
+    def _build_bundle() -> tuple[int, bytes]:
+        entities, soap = nlp_service.extract_and_summarize(job.result_text)
+        bundle = demo_fhir_exporter.build_fhir_bundle(job_id=job_id, entities=entities, soap_note=soap)
+        # Encode here, off the event loop, and skip re-validating the
+        # free-form bundle dict through FHIRExportResponse.
+        return len(bundle["entry"]), orjson.dumps({"bundle": bundle})
+
+    entry_count, body = await run_in_threadpool(_build_bundle)
 
     audit_service.log_event(
         action="export_transcription_fhir",
         resource_type="transcription_job",
         resource_id=str(job_id),
-        extra={"bundle_entry_count": len(bundle.get("entry", []))},
+        extra={"bundle_entry_count": entry_count},
     )
 
-    return FHIRExportResponse(bundle=bundle)
+    return Response(content=body, media_type="application/json")
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Centralized application settings.
 
     This keeps environment-variable handling in one place so other modules can
     depend on strongly-typed attributes instead of calling os.getenv
-    directly.
+    directly. Instances are immutable; use :func:`get_settings` to obtain the
+    shared process-wide instance.
     """
 
     # ASR backend selection: "demo" (default) or "whisper".
@@ -33,8 +35,12 @@ class Settings:
     multichain_audit_stream: str = os.getenv("MULTICHAIN_AUDIT_STREAM", "audit")
     multichain_rpc_timeout_seconds: float = float(os.getenv("MULTICHAIN_RPC_TIMEOUT_SECONDS", "2.0"))
 
-    # ASR backend selection: "demo" (default) or "whisper".
-    asr_backend: str = os.getenv("ASR_BACKEND", "demo")
+    # Optional ASR batching. When ASR_BATCH_ENABLED=true every transcription
+    # is routed through a single worker that groups up to ASR_BATCH_MAX_SIZE
+    # requests arriving within ASR_BATCH_MAX_WAIT_MS into one backend call.
+    asr_batch_enabled: bool = os.getenv("ASR_BATCH_ENABLED", "false").lower() == "true"
+    asr_batch_max_size: int = int(os.getenv("ASR_BATCH_MAX_SIZE", "8"))
+    asr_batch_max_wait_ms: int = int(os.getenv("ASR_BATCH_MAX_WAIT_MS", "20"))
 
     # Translation backend selection: "demo" (default) or "llm".
     translation_backend: str = os.getenv("TRANSLATION_BACKEND", "demo")
@@ -46,6 +52,13 @@ class Settings:
     nlp_ner_backend: str = os.getenv("NLP_NER_BACKEND", "demo")
     nlp_coding_backend: str = os.getenv("NLP_CODING_BACKEND", "demo")
     nlp_soap_backend: str = os.getenv("NLP_SOAP_BACKEND", "demo")
+    # Upper bound on the combined transcript text (in characters) fed into the
+    # NLP pipeline for session/encounter level analysis. 0 disables the cap.
+    max_nlp_chars: int = int(os.getenv("MAX_NLP_CHARS", "200000"))
+    # Number of NER/SOAP results kept per process, keyed by transcript hash and
+    # consent context, so re-analysing or exporting an unchanged transcript
+    # skips the pipeline. 0 disables the cache.
+    nlp_cache_maxsize: int = int(os.getenv("NLP_CACHE_MAXSIZE", "256"))
 
     # Directory where uploaded audio files are stored.
     audio_upload_dir: Path = Path(os.getenv("AUDIO_UPLOAD_DIR", "uploads"))
@@ -53,6 +66,17 @@ class Settings:
     # Optional database configuration for SQL-backed repositories.
     database_url: Optional[str] = os.getenv("DATABASE_URL")
     use_sql_repos: bool = os.getenv("USE_SQL_REPOS", "false").lower() == "true"
+    # Per-process read cache for SQL encounter/note lookups. Entries expire
+    # after REPO_CACHE_TTL_SECONDS (0 disables the cache).
+    repo_cache_maxsize: int = int(os.getenv("REPO_CACHE_MAXSIZE", "4096"))
+    repo_cache_ttl_seconds: float = float(os.getenv("REPO_CACHE_TTL_SECONDS", "30"))
+    # Cache for built patient timelines (invalidated on any encounter/note
+    # write in this process; the TTL bounds staleness across processes).
+    timeline_cache_maxsize: int = int(os.getenv("TIMELINE_CACHE_MAXSIZE", "1024"))
+    timeline_cache_ttl_seconds: float = float(os.getenv("TIMELINE_CACHE_TTL_SECONDS", "60"))
+    # Same policy for analytics aggregates polled by dashboards.
+    analytics_cache_maxsize: int = int(os.getenv("ANALYTICS_CACHE_MAXSIZE", "1024"))
+    analytics_cache_ttl_seconds: float = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "30"))
 
     # Optional settings for external providers.
     openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
@@ -89,15 +113,57 @@ class Settings:
     enable_api_auth: bool = os.getenv("ENABLE_API_AUTH", "false").lower() == "true"
     # Comma-separated list of allowed API keys when auth is enabled.
     api_keys: Optional[str] = os.getenv("API_KEYS")
+    # API_KEYS parsed once into a set (whitespace stripped, empties dropped)
+    # so request authentication is a single membership test.
+    api_keys_set: FrozenSet[str] = field(init=False, default=frozenset())
+
+    # Audit log batching. Once the background flusher is started, audit events
+    # are written in batches of up to AUDIT_BATCH_MAX_EVENTS, waiting at most
+    # AUDIT_BATCH_INTERVAL_MS for more events to arrive.
+    audit_batch_max_events: int = int(os.getenv("AUDIT_BATCH_MAX_EVENTS", "100"))
+    audit_batch_interval_ms: int = int(os.getenv("AUDIT_BATCH_INTERVAL_MS", "50"))
+    # Events queued beyond AUDIT_QUEUE_MAXSIZE are written inline by the
+    # caller instead, so a stalled flusher cannot grow memory without bound.
+    audit_queue_maxsize: int = int(os.getenv("AUDIT_QUEUE_MAXSIZE", "10000"))
+    # When AUDIT_LOG_STRUCTURED=true the "audit" logger is expected to have a
+    # structured (e.g. JSON) formatter: events are logged as
+    # ``logger.info("audit_event", extra={"audit": payload})`` and serialized
+    # by the handler instead of being pre-encoded into the message.
+    audit_log_structured: bool = os.getenv("AUDIT_LOG_STRUCTURED", "false").lower() == "true"
 
     # Request size limits (in bytes).
     max_upload_bytes: int = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
     max_ws_bytes: int = int(os.getenv("MAX_WS_BYTES", str(10 * 1024 * 1024)))
 
+    # Live (WebSocket) transcription tuning. Partial ASR runs over the rolling
+    # window of uncommitted audio at most once per WS_ASR_MIN_INTERVAL_MS, and
+    # a window transcript is committed once it is unchanged for
+    # WS_ASR_COMMIT_AFTER consecutive runs.
+    ws_asr_min_interval_ms: int = int(os.getenv("WS_ASR_MIN_INTERVAL_MS", "500"))
+    ws_asr_commit_after: int = int(os.getenv("WS_ASR_COMMIT_AFTER", "3"))
+    # Userspace write buffer for the live audio temp file. Frames are
+    # coalesced here and only flushed to disk before an ASR run.
+    ws_write_buffer_bytes: int = int(os.getenv("WS_WRITE_BUFFER_BYTES", str(256 * 1024)))
+
     # CORS configuration: comma-separated origins (e.g. "https://app.example.com,https://admin.example.com").
     # Default is "*" (allow all) which is acceptable for local development but
     # should be tightened in production.
     cors_allow_origins: str = os.getenv("CORS_ALLOW_ORIGINS", "*")
+    # CORS_ALLOW_ORIGINS split once (whitespace stripped, empties dropped).
+    cors_allow_origins_list: Tuple[str, ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        keys = frozenset(key.strip() for key in (self.api_keys or "").split(",") if key.strip())
+        object.__setattr__(self, "api_keys_set", keys)
+        origins = tuple(origin.strip() for origin in self.cors_allow_origins.split(",") if origin.strip())
+        object.__setattr__(self, "cors_allow_origins_list", origins)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared, lazily constructed Settings instance."""
+
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+
+class ASRLike(Protocol):
+    """Protocol for ASR-like backends used by BatchingASRBackend.
+
+    Mirrors the signature of src.backend.services.transcription ASR backends
+    without importing them directly, to avoid circular imports.
+    """
+
+    def transcribe(self, audio_url: str, language_code: Optional[str] = None) -> str:  # pragma: no cover - protocol
+        ...
+
+
+# (audio_url, language_code) pairs as passed to ``transcribe_batch``.
+ASRRequest = Tuple[str, Optional[str]]
+
+
+class BatchingASRBackend:
+    """Wrapper ASR backend that funnels all transcriptions through one worker.
+
+    Callers (upload jobs, async jobs, live WebSocket windows) block on a future
+    while a single daemon thread collects up to ``max_batch_size`` requests,
+    waiting at most ``max_wait_ms`` after the first one, and hands them to the
+    base backend together. Backends that can decode several clips in one
+    model pass expose ``transcribe_batch(requests) -> list[str]``; others are
+    called once per request, still on the single worker, so GPU-resident
+    models are never driven from several threads at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_backend: ASRLike,
+        max_batch_size: int = 8,
+        max_wait_ms: int = 20,
+    ) -> None:
+        self._base = base_backend
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait_s = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[ASRRequest, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio_url: str, language_code: Optional[str] = None) -> str:
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put(((audio_url, language_code), future))
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="asr-batcher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # The wait is bounded from the first request, not per get, so a
+            # steady trickle cannot hold a batch open for longer.
+            deadline = time.monotonic() + self._max_wait_s
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._process([request for request, _ in batch], [future for _, future in batch])
+
+    def _process(self, requests: Sequence[ASRRequest], futures: Sequence[Future]) -> None:
+        transcribe_batch = getattr(self._base, "transcribe_batch", None)
+        if transcribe_batch is not None and len(requests) > 1:
+            try:
+                results: List[str] = list(transcribe_batch(list(requests)))
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                return
+            if len(results) != len(requests):
+                # Never leave callers blocked on futures with no result.
+                exc = RuntimeError(
+                    f"transcribe_batch returned {len(results)} results for {len(requests)} requests"
+                )
+                for future in futures:
+                    future.set_exception(exc)
+                return
+            for future, result in zip(futures, results):
+                future.set_result(result)
+            return
+
+        for (audio_url, language_code), future in zip(requests, futures):
+            try:
+                future.set_result(self._base.transcribe(audio_url, language_code=language_code))
+            except Exception as exc:
+                future.set_exception(exc)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Small thread-safe LRU cache with optional per-entry expiry.
+
+    Entries are evicted least-recently-used once ``maxsize`` is exceeded and
+    treated as missing once older than ``ttl_seconds`` (``None`` disables
+    expiry). ``None`` is a valid cached value; use :meth:`lookup` to tell a
+    cached ``None`` apart from a miss.
+    """
+
+    def __init__(self, *, maxsize: int, ttl_seconds: Optional[float] = None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Optional[V]]:
+        """Return ``(hit, value)`` for ``key``."""
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            stored_at, value = entry
+            if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        hit, value = self.lookup(key)
+        return value if hit else default
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class VersionCounter:
+    """Thread-safe monotonically increasing write counter.
+
+    Derived caches include :attr:`value` in their keys; bumping it after a
+    committed write makes every entry built from older data unreachable
+    without tracking which keys were affected.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> None:
+        with self._lock:
+            self._value += 1
+
+
+# Bumped after every committed encounter/note write (in-memory or SQL).
+# Patient timelines and analytics aggregates key their caches on it.
+encounter_data_version = VersionCounter()
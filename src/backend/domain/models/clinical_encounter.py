@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -15,6 +16,15 @@ class EncounterStatus(str, Enum):
     FINALIZED = "FINALIZED"
 
 
+# Value -> member map for hydrating stored status strings with one dict probe
+# instead of an Enum call per row.
+ENCOUNTER_STATUS_BY_VALUE: Dict[str, EncounterStatus] = {s.value: s for s in EncounterStatus}
+
+# Statuses that move to READY_FOR_REVIEW once a note is drafted or the
+# encounter is submitted. Built once rather than as a set literal per check.
+PRE_REVIEW_STATUSES: FrozenSet[EncounterStatus] = frozenset({EncounterStatus.CREATED, EncounterStatus.IN_PROGRESS})
+
+
 class ClinicalEncounter(BaseModel):
     """Represents a clinical encounter grouping one or more transcription jobs.
 
@@ -34,3 +44,13 @@ class ClinicalEncounter(BaseModel):
     assigned_scribe_id: Optional[str] = None
     # Logical tenant/organization this encounter belongs to.
     tenant_id: str
+
+    @cached_property
+    def created_at_iso(self) -> str:
+        """``created_at`` in ISO 8601, formatted once per instance.
+
+        List views such as the scribe queue emit this for every row on every
+        poll; ``created_at`` never changes after creation.
+        """
+
+        return self.created_at.isoformat()
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TimelineEventType(str, Enum):
@@ -17,6 +17,10 @@ class TimelineEventType(str, Enum):
 
 
 class TimelineEvent(BaseModel):
+    # Built timelines are cached and shared between requests, so events are
+    # immutable once created.
+    model_config = ConfigDict(frozen=True)
+
     type: TimelineEventType
     timestamp: datetime
     encounter_id: Optional[UUID] = None
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel
 
 
 class TranscriptJobStatus(str, Enum):
@@ -15,11 +15,18 @@ class TranscriptJobStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# Value -> member map for hydrating stored status strings with one dict probe
+# instead of an Enum call per row.
+JOB_STATUS_BY_VALUE: Dict[str, TranscriptJobStatus] = {s.value: s for s in TranscriptJobStatus}
+
+
 class TranscriptJob(BaseModel):
     id: UUID
     created_at: datetime
     status: TranscriptJobStatus
-    audio_url: HttpUrl | str
+    # Plain string: callers pass either a URL (already validated at the API
+    # edge) or a local upload path, so a URL union would only add work.
+    audio_url: str
     language_code: Optional[str] = None  # Source language (e.g., "en-US")
     target_language: Optional[str] = None  # Desired translation target (e.g., "es-ES")
     result_text: Optional[str] = None  # Transcript in source language
@@ -41,11 +41,15 @@ class DecisionSupportSuggestion(BaseModel):
         details: Optional[str] = None,
         evidence_refs: Optional[List[str]] = None,
     ) -> "DecisionSupportSuggestion":
-        return cls(
+        # Rule engines call this in loops with enum members and literal
+        # strings, so skip validation.
+        return cls.model_construct(
             id=uuid4(),
             type=type,
             severity=severity,
             summary=summary,
             details=details,
             evidence_refs=evidence_refs or [],
+            source="demo_rule",
+            regulated=False,
         )
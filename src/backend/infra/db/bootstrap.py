@@ -2,13 +2,11 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import create_engine
-
 from src.backend.config import settings
-from src.backend.infra.db.models import Base
-from src.backend.infra.db.session import create_sqlalchemy_session_factory
-from src.backend.infra.db.sql_encounters import SqlEncounterRepository
-from src.backend.infra.db.sql_notes_jobs import SqlClinicalNoteRepository, SqlTranscriptionJobRepository
+from src.backend.infra.db.cached import (
+    CachedClinicalNoteRepository,
+    CachedEncounterRepository,
+)
 from src.backend.infra.db import inmemory as inmemory_repos
 
 
@@ -30,6 +28,16 @@ def init_sql_repositories(database_url: Optional[str] = None) -> None:  # pragma
         # in-memory repos in place.
         return
 
+    # SQLAlchemy and the SQL repositories are only imported when enabled, so
+    # in-memory deployments and tests do not pay for them at startup.
+    from sqlalchemy import create_engine
+
+    from src.backend.infra.db.models import Base
+    from src.backend.infra.db.session import create_sqlalchemy_session_factory, set_default_session_factory
+    from src.backend.infra.db.sql_analytics import SqlAnalyticsRepository
+    from src.backend.infra.db.sql_encounters import SqlEncounterRepository
+    from src.backend.infra.db.sql_notes_jobs import SqlClinicalNoteRepository, SqlTranscriptionJobRepository
+
     engine = create_engine(db_url, future=True)
 
     # Create tables if they do not exist. In a real deployment this should be
@@ -37,10 +45,28 @@ def init_sql_repositories(database_url: Optional[str] = None) -> None:  # pragma
     Base.metadata.create_all(engine)
 
     session_factory = create_sqlalchemy_session_factory(db_url)
+    set_default_session_factory(session_factory)
 
     # Swap repository singletons to SQL-backed implementations so that existing
     # imports (e.g., encounter_repository from infra.db.inmemory) now point at
     # real DB-backed repositories.
-    inmemory_repos.encounter_repository = SqlEncounterRepository(session_factory)  # type: ignore[assignment]
-    inmemory_repos.clinical_note_repository = SqlClinicalNoteRepository(session_factory)  # type: ignore[assignment]
-    inmemory_repos.transcription_job_repository = SqlTranscriptionJobRepository(session_factory)  # type: ignore[assignment]
+    encounter_repository = SqlEncounterRepository(session_factory)
+    clinical_note_repository = SqlClinicalNoteRepository(session_factory)
+    transcription_job_repository = SqlTranscriptionJobRepository(session_factory)
+    if settings.repo_cache_ttl_seconds > 0:
+        # Hot encounter/note lookups are repeated across a client's requests;
+        # serve them from a short-lived per-process cache.
+        encounter_repository = CachedEncounterRepository(
+            encounter_repository,
+            maxsize=settings.repo_cache_maxsize,
+            ttl_seconds=settings.repo_cache_ttl_seconds,
+        )
+        clinical_note_repository = CachedClinicalNoteRepository(
+            clinical_note_repository,
+            maxsize=settings.repo_cache_maxsize,
+            ttl_seconds=settings.repo_cache_ttl_seconds,
+        )
+    inmemory_repos.encounter_repository = encounter_repository  # type: ignore[assignment]
+    inmemory_repos.clinical_note_repository = clinical_note_repository  # type: ignore[assignment]
+    inmemory_repos.transcription_job_repository = transcription_job_repository  # type: ignore[assignment]
+    inmemory_repos.analytics_repository = SqlAnalyticsRepository(session_factory)  # type: ignore[assignment]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.backend.core.cache import TTLCache
+from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
+from src.backend.domain.models.clinical_note import ClinicalNote
+from src.backend.infra.db.repositories import (
+    ClinicalNoteRepository,
+    EncounterRepository,
+    EncounterSummaryRow,
+)
+from src.backend.infra.db.session import after_commit
+from src.backend.tenancy import get_current_tenant
+
+
+class CachedEncounterRepository(EncounterRepository):
+    """Read-through cache in front of a (typically SQL-backed) EncounterRepository.
+
+    ``get`` results are cached per ``(tenant_id, encounter_id)`` and
+    invalidated by ``save``. Misses are not cached, so a row created by another
+    process is visible immediately. Callers receive a copy, so mutating a returned
+    encounter without saving it never leaks into the cache. The TTL bounds
+    staleness when several API processes write to the same database.
+    """
+
+    def __init__(self, inner: EncounterRepository, *, maxsize: int, ttl_seconds: float) -> None:
+        self._inner = inner
+        self._cache: TTLCache[ClinicalEncounter] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def get(self, encounter_id: UUID) -> Optional[ClinicalEncounter]:
+        key = (get_current_tenant(), encounter_id)
+        encounter = self._cache.get(key)
+        if encounter is None:
+            encounter = self._inner.get(encounter_id)
+            if encounter is None:
+                return None
+            self._cache.set(key, encounter)
+        return encounter.model_copy(deep=True)
+
+    def list_by_filters(
+        self,
+        *,
+        clinician_id: Optional[str] = None,
+        patient_id: Optional[str] = None,
+        status: Optional[EncounterStatus] = None,
+        status_not: Optional[EncounterStatus] = None,
+    ) -> Iterable[ClinicalEncounter]:
+        return self._inner.list_by_filters(
+            clinician_id=clinician_id, patient_id=patient_id, status=status, status_not=status_not
+        )
+
+    def list_summaries_by_filters(
+        self,
+        *,
+        clinician_id: Optional[str] = None,
+        patient_id: Optional[str] = None,
+        status: Optional[EncounterStatus] = None,
+    ) -> Iterable[EncounterSummaryRow]:
+        return self._inner.list_summaries_by_filters(
+            clinician_id=clinician_id, patient_id=patient_id, status=status
+        )
+
+    def save(self, encounter: ClinicalEncounter) -> None:
+        # Invalidate again once the write has committed (deferred to the end
+        # of an enclosing unit of work) so a concurrent read cannot leave the
+        # pre-save row cached.
+        key = (encounter.tenant_id, encounter.id)
+        self._cache.pop(key)
+        self._inner.save(encounter)
+        after_commit(lambda: self._cache.pop(key))
+
+    def save_many(self, encounters: Iterable[ClinicalEncounter]) -> None:
+        encounters = list(encounters)
+        keys = [(e.tenant_id, e.id) for e in encounters]
+        self._pop_all(keys)
+        self._inner.save_many(encounters)
+        after_commit(lambda: self._pop_all(keys))
+
+    def _pop_all(self, keys: List[Tuple[str, UUID]]) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+
+class CachedClinicalNoteRepository(ClinicalNoteRepository):
+    """Read-through cache for ``get_by_encounter`` lookups.
+
+    Keyed by ``(tenant_id, encounter_id)`` and invalidated when a note for
+    that encounter is saved. Only found notes are cached, so a note written by
+    another process is picked up on the next lookup. ``get`` by note id is
+    passed through.
+    """
+
+    def __init__(self, inner: ClinicalNoteRepository, *, maxsize: int, ttl_seconds: float) -> None:
+        self._inner = inner
+        self._by_encounter: TTLCache[ClinicalNote] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def get(self, note_id: UUID) -> Optional[ClinicalNote]:
+        return self._inner.get(note_id)
+
+    def get_by_encounter(self, encounter_id: UUID) -> Optional[ClinicalNote]:
+        key = (get_current_tenant(), encounter_id)
+        note = self._by_encounter.get(key)
+        if note is None:
+            note = self._inner.get_by_encounter(encounter_id)
+            if note is None:
+                return None
+            self._by_encounter.set(key, note)
+        return note.model_copy(deep=True)
+
+    def get_by_encounters(self, encounter_ids: Iterable[UUID]) -> Dict[UUID, ClinicalNote]:
+        tenant_id = get_current_tenant()
+        notes: Dict[UUID, ClinicalNote] = {}
+        misses = []
+        for encounter_id in encounter_ids:
+            note = self._by_encounter.get((tenant_id, encounter_id))
+            if note is None:
+                misses.append(encounter_id)
+            else:
+                notes[encounter_id] = note.model_copy(deep=True)
+        if misses:
+            for encounter_id, note in self._inner.get_by_encounters(misses).items():
+                self._by_encounter.set((tenant_id, encounter_id), note)
+                notes[encounter_id] = note.model_copy(deep=True)
+        return notes
+
+    def encounter_ids_with_notes(self) -> Set[UUID]:
+        return self._inner.encounter_ids_with_notes()
+
+    def save(self, note: ClinicalNote) -> None:
+        key = (note.tenant_id, note.encounter_id)
+        self._by_encounter.pop(key)
+        self._inner.save(note)
+        after_commit(lambda: self._by_encounter.pop(key))
+
+    def save_many(self, notes: Iterable[ClinicalNote]) -> None:
+        notes = list(notes)
+        keys = [(n.tenant_id, n.encounter_id) for n in notes]
+        self._pop_all(keys)
+        self._inner.save_many(notes)
+        after_commit(lambda: self._pop_all(keys))
+
+    def _pop_all(self, keys: List[Tuple[str, UUID]]) -> None:
+        for key in keys:
+            self._by_encounter.pop(key)
+
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Set
 from uuid import UUID
 
+from src.backend.core.cache import encounter_data_version
 from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
 from src.backend.domain.models.clinical_note import ClinicalNote
 from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.infra.db.repositories import (
+    AnalyticsRepository,
     EncounterRepository,
     ClinicalNoteRepository,
+    FinalizationStats,
     TranscriptionJobRepository,
 )
 from src.backend.services.encounters.service import encounter_service
@@ -18,12 +21,8 @@ from src.backend.tenancy import get_current_tenant
 
 class InMemoryEncounterRepository(EncounterRepository):
     def get(self, encounter_id: UUID) -> Optional[ClinicalEncounter]:
-        enc = encounter_service.get_encounter(encounter_id)
-        if enc is None:
-            return None
-        if enc.tenant_id != get_current_tenant():
-            return None
-        return enc
+        # encounter_service.get_encounter already scopes by tenant.
+        return encounter_service.get_encounter(encounter_id)
 
     def list_by_filters(
         self,
@@ -31,44 +30,45 @@ class InMemoryEncounterRepository(EncounterRepository):
         clinician_id: Optional[str] = None,
         patient_id: Optional[str] = None,
         status: Optional[EncounterStatus] = None,
+        status_not: Optional[EncounterStatus] = None,
     ) -> Iterable[ClinicalEncounter]:
-        current_tenant = get_current_tenant()
-        for enc in encounter_service._encounters.values():  # type: ignore[attr-defined]
-            if enc.tenant_id != current_tenant:
-                continue
+        candidates = encounter_service.list_encounters_for_tenant(
+            get_current_tenant(),
+            clinician_id=clinician_id,
+            patient_id=patient_id,
+        )
+        for enc in candidates:
             if clinician_id is not None and enc.clinician_id != clinician_id:
                 continue
             if patient_id is not None and enc.patient_id != patient_id:
                 continue
             if status is not None and enc.status != status:
                 continue
+            if status_not is not None and enc.status == status_not:
+                continue
             yield enc
 
     def save(self, encounter: ClinicalEncounter) -> None:
         # The underlying service mutates encounters in-place; assigning back keeps
         # semantics consistent for now.
-        encounter_service._encounters[encounter.id] = encounter  # type: ignore[attr-defined]
+        encounter_service.store_encounter(encounter)
+        encounter_data_version.bump()
 
 
 class InMemoryClinicalNoteRepository(ClinicalNoteRepository):
     def get(self, note_id: UUID) -> Optional[ClinicalNote]:
-        note = encounter_service.get_note(note_id)
-        if note is None:
-            return None
-        if note.tenant_id != get_current_tenant():
-            return None
-        return note
+        # The encounter service note lookups already scope by tenant.
+        return encounter_service.get_note(note_id)
 
     def get_by_encounter(self, encounter_id: UUID) -> Optional[ClinicalNote]:
-        note = encounter_service._find_note_for_encounter(encounter_id)  # type: ignore[attr-defined]
-        if note is None:
-            return None
-        if note.tenant_id != get_current_tenant():
-            return None
-        return note
+        return encounter_service._find_note_for_encounter(encounter_id)  # type: ignore[attr-defined]
+
+    def encounter_ids_with_notes(self) -> Set[UUID]:
+        return {note.encounter_id for note in encounter_service.list_notes_for_tenant(get_current_tenant())}
 
     def save(self, note: ClinicalNote) -> None:
-        encounter_service._notes[note.id] = note  # type: ignore[attr-defined]
+        encounter_service.store_note(note)
+        encounter_data_version.bump()
 
 
 class InMemoryTranscriptionJobRepository(TranscriptionJobRepository):
@@ -78,6 +78,29 @@ class InMemoryTranscriptionJobRepository(TranscriptionJobRepository):
         return job
 
 
+class InMemoryAnalyticsRepository(AnalyticsRepository):
+    def finalization_stats(self, *, clinician_id: Optional[str] = None) -> FinalizationStats:
+        encounters = notes = finalized = timed = pending_review = 0
+        timed_seconds = 0.0
+        for enc in encounter_service.list_encounters_for_tenant(get_current_tenant(), clinician_id=clinician_id):
+            if clinician_id is not None and enc.clinician_id != clinician_id:
+                continue
+            encounters += 1
+            note = encounter_service._find_note_for_encounter(enc.id)  # type: ignore[attr-defined]
+            if note is None:
+                continue
+            notes += 1
+            if note.is_finalized:
+                finalized += 1
+                if enc.created_at <= note.updated_at:
+                    timed += 1
+                    timed_seconds += (note.updated_at - enc.created_at).total_seconds()
+            elif enc.status == EncounterStatus.READY_FOR_REVIEW:
+                pending_review += 1
+        return FinalizationStats(encounters, notes, finalized, timed, timed_seconds, pending_review)
+
+
 encounter_repository: EncounterRepository = InMemoryEncounterRepository()
 clinical_note_repository: ClinicalNoteRepository = InMemoryClinicalNoteRepository()
 transcription_job_repository: TranscriptionJobRepository = InMemoryTranscriptionJobRepository()
+analytics_repository: AnalyticsRepository = InMemoryAnalyticsRepository()
@@ -1,18 +1,52 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Column, DateTime, String
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy.engine import Dialect
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+from src.backend.domain.models.clinical_encounter import ENCOUNTER_STATUS_BY_VALUE, ClinicalEncounter
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class UUIDList(TypeDecorator):
+    """List of UUIDs stored as native ``uuid[]`` on Postgres.
+
+    Postgres returns ``list[UUID]`` directly, so hydration needs no parsing.
+    Other dialects (e.g. SQLite in local dev) store a JSON list of strings.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(PG_UUID(as_uuid=True)))
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value: Optional[List[UUID]], dialect: Dialect) -> Any:
+        if value is None:
+            return []
+        if dialect.name == "postgresql":
+            return list(value)
+        return [str(v) for v in value]
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> List[UUID]:
+        if not value:
+            return []
+        if dialect.name == "postgresql":
+            return value
+        return [UUID(v) for v in value]
+
+
 class EncounterORM(Base):  # pragma: no cover - not wired yet
     __tablename__ = "encounters"
 
@@ -22,44 +56,51 @@ class EncounterORM(Base):  # pragma: no cover - not wired yet
     patient_id: Mapped[str | None] = mapped_column(String, nullable=True)
     status: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
-    # For the MVP we store transcription_job_ids as a simple comma-separated
-    # list of UUID strings. A more normalized schema can be introduced later.
-    transcription_job_ids: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Stored as a native uuid[] (see UUIDList). A more normalized schema can
+    # be introduced later.
+    transcription_job_ids: Mapped[List[UUID]] = mapped_column(UUIDList(), nullable=False, default=list)
     # Tenant/organization identifier for multitenancy.
     tenant_id: Mapped[str] = mapped_column(String, nullable=False)
 
     @classmethod
-    def from_domain(cls, encounter: "ClinicalEncounter") -> "EncounterORM":  # type: ignore[name-defined]
-        from src.backend.domain.models.clinical_encounter import ClinicalEncounter
-
-        job_ids = ",".join(str(j) for j in encounter.transcription_job_ids) if encounter.transcription_job_ids else None
-        return cls(
-            id=encounter.id,
-            created_at=encounter.created_at,
-            clinician_id=encounter.clinician_id,
-            patient_id=encounter.patient_id,
-            status=encounter.status.value,
-            title=encounter.title,
-            transcription_job_ids=job_ids,
-            tenant_id=encounter.tenant_id,
-        )
+    def from_domain(cls, encounter: ClinicalEncounter) -> EncounterORM:
+        return cls(**cls.values_from_domain(encounter))
+
+    @staticmethod
+    def values_from_domain(encounter: ClinicalEncounter) -> Dict[str, Any]:
+        """Column values for ``encounter``, as used by bulk INSERT/UPDATE."""
+
+        return {
+            "id": encounter.id,
+            "created_at": encounter.created_at,
+            "clinician_id": encounter.clinician_id,
+            "patient_id": encounter.patient_id,
+            "status": encounter.status.value,
+            "title": encounter.title,
+            "transcription_job_ids": list(encounter.transcription_job_ids),
+            "tenant_id": encounter.tenant_id,
+        }
 
-    def to_domain(self) -> "ClinicalEncounter":  # type: ignore[name-defined]
-        from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
+    def to_domain(self) -> ClinicalEncounter:
+        return self.domain_from_row(self)
 
-        job_ids: List[UUID] = []
-        if self.transcription_job_ids:
-            from uuid import UUID as _UUID
+    @staticmethod
+    def domain_from_row(row: Any) -> ClinicalEncounter:
+        """Build a ClinicalEncounter from an ORM instance or a Core result row.
 
-            job_ids = [_UUID(v) for v in self.transcription_job_ids.split(",") if v]
+        Anything exposing the ``encounters`` columns as attributes works, so
+        list queries can select the table directly and skip ORM instances.
+        """
 
-        return ClinicalEncounter(
-            id=self.id,
-            created_at=self.created_at,
-            clinician_id=self.clinician_id,
-            patient_id=self.patient_id,
-            status=EncounterStatus(self.status),
-            title=self.title,
-            transcription_job_ids=job_ids,
-            tenant_id=self.tenant_id,
+        # Rows were validated on the way in and columns are already typed, so
+        # skip pydantic validation when hydrating (hot on list endpoints).
+        return ClinicalEncounter.model_construct(
+            id=row.id,
+            created_at=row.created_at,
+            clinician_id=row.clinician_id,
+            patient_id=row.patient_id,
+            status=ENCOUNTER_STATUS_BY_VALUE[row.status],
+            title=row.title,
+            transcription_job_ids=list(row.transcription_job_ids or ()),
+            tenant_id=row.tenant_id,
         )
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.backend.domain.models.clinical_note import ClinicalNote, ClinicalNoteSection
+from src.backend.domain.models.transcription_job import JOB_STATUS_BY_VALUE, TranscriptJob
 from src.backend.infra.db.models import Base
 
 
 class ClinicalNoteORM(Base):  # pragma: no cover - not wired yet
     __tablename__ = "clinical_notes"
+    # Matches get_by_encounter(s): equality on tenant and encounter, newest
+    # note first.
+    __table_args__ = (Index("ix_note_tenant_enc_created", "tenant_id", "encounter_id", "created_at"),)
 
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
     encounter_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False, index=True)
@@ -33,31 +38,35 @@ class ClinicalNoteORM(Base):  # pragma: no cover - not wired yet
     tenant_id: Mapped[str] = mapped_column(String, nullable=False)
 
     @classmethod
-    def from_domain(cls, note: "ClinicalNote") -> "ClinicalNoteORM":  # type: ignore[name-defined]
-        from src.backend.domain.models.clinical_note import ClinicalNote
-
-        return cls(
-            id=note.id,
-            encounter_id=note.encounter_id,
-            created_at=note.created_at,
-            updated_at=note.updated_at,
-            created_by=note.created_by,
-            last_edited_by=note.last_edited_by,
-            is_finalized=note.is_finalized,
-            reviewed_by=note.reviewed_by,
-            reviewed_at=note.reviewed_at,
-            review_comment=note.review_comment,
-            subjective=note.subjective.text,
-            objective=note.objective.text,
-            assessment=note.assessment.text,
-            plan=note.plan.text,
-            tenant_id=note.tenant_id,
-        )
-
-    def to_domain(self) -> "ClinicalNote":  # type: ignore[name-defined]
-        from src.backend.domain.models.clinical_note import ClinicalNote, ClinicalNoteSection
-
-        return ClinicalNote(
+    def from_domain(cls, note: ClinicalNote) -> ClinicalNoteORM:
+        return cls(**cls.values_from_domain(note))
+
+    @staticmethod
+    def values_from_domain(note: ClinicalNote) -> Dict[str, Any]:
+        """Column values for ``note``, as used by bulk INSERT/UPDATE."""
+
+        return {
+            "id": note.id,
+            "encounter_id": note.encounter_id,
+            "created_at": note.created_at,
+            "updated_at": note.updated_at,
+            "created_by": note.created_by,
+            "last_edited_by": note.last_edited_by,
+            "is_finalized": note.is_finalized,
+            "reviewed_by": note.reviewed_by,
+            "reviewed_at": note.reviewed_at,
+            "review_comment": note.review_comment,
+            "subjective": note.subjective.text,
+            "objective": note.objective.text,
+            "assessment": note.assessment.text,
+            "plan": note.plan.text,
+            "tenant_id": note.tenant_id,
+        }
+
+    def to_domain(self) -> ClinicalNote:
+        # Trusted, typed columns: skip validation when hydrating (see
+        # EncounterORM.to_domain).
+        return ClinicalNote.model_construct(
             id=self.id,
             encounter_id=self.encounter_id,
             created_at=self.created_at,
@@ -68,10 +77,10 @@ class ClinicalNoteORM(Base):  # pragma: no cover - not wired yet
             reviewed_by=self.reviewed_by,
             reviewed_at=self.reviewed_at,
             review_comment=self.review_comment,
-            subjective=ClinicalNoteSection(text=self.subjective),
-            objective=ClinicalNoteSection(text=self.objective),
-            assessment=ClinicalNoteSection(text=self.assessment),
-            plan=ClinicalNoteSection(text=self.plan),
+            subjective=ClinicalNoteSection.model_construct(text=self.subjective),
+            objective=ClinicalNoteSection.model_construct(text=self.objective),
+            assessment=ClinicalNoteSection.model_construct(text=self.assessment),
+            plan=ClinicalNoteSection.model_construct(text=self.plan),
             tenant_id=self.tenant_id,
         )
 
@@ -91,14 +100,12 @@ class TranscriptJobORM(Base):  # pragma: no cover - not wired yet
     tenant_id: Mapped[str] = mapped_column(String, nullable=False)
 
     @classmethod
-    def from_domain(cls, job: "TranscriptJob") -> "TranscriptJobORM":  # type: ignore[name-defined]
-        from src.backend.domain.models.transcription_job import TranscriptJob
-
+    def from_domain(cls, job: TranscriptJob) -> TranscriptJobORM:
         return cls(
             id=job.id,
             created_at=job.created_at,
             status=job.status.value,
-            audio_url=str(job.audio_url),
+            audio_url=job.audio_url,
             language_code=job.language_code,
             target_language=job.target_language,
             result_text=job.result_text,
@@ -106,13 +113,12 @@ class TranscriptJobORM(Base):  # pragma: no cover - not wired yet
             tenant_id=job.tenant_id,
         )
 
-    def to_domain(self) -> "TranscriptJob":  # type: ignore[name-defined]
-        from src.backend.domain.models.transcription_job import TranscriptJob, TranscriptJobStatus
-
-        return TranscriptJob(
+    def to_domain(self) -> TranscriptJob:
+        # Trusted, typed columns: skip validation when hydrating.
+        return TranscriptJob.model_construct(
             id=self.id,
             created_at=self.created_at,
-            status=TranscriptJobStatus(self.status),
+            status=JOB_STATUS_BY_VALUE[self.status],
             audio_url=self.audio_url,
             language_code=self.language_code,
             target_language=self.target_language,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Set
 from uuid import UUID
 
 from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
@@ -9,6 +10,32 @@ from src.backend.domain.models.clinical_note import ClinicalNote
 from src.backend.domain.models.transcription_job import TranscriptJob
 
 
+class EncounterSummaryRow(NamedTuple):
+    """Projection of the encounter columns needed for list views."""
+
+    id: UUID
+    created_at: datetime
+    clinician_id: Optional[str]
+    patient_id: Optional[str]
+    status: EncounterStatus
+    title: Optional[str]
+
+
+class FinalizationStats(NamedTuple):
+    """Note finalization aggregates over the current tenant's encounters.
+
+    ``timed`` counts finalized notes last updated at or after their
+    encounter's creation; ``timed_seconds`` is the sum of those delays.
+    """
+
+    encounters: int
+    notes: int
+    finalized: int
+    timed: int
+    timed_seconds: float
+    pending_review: int
+
+
 class EncounterRepository(ABC):
     @abstractmethod
     def get(self, encounter_id: UUID) -> Optional[ClinicalEncounter]:
@@ -21,13 +48,42 @@ class EncounterRepository(ABC):
         clinician_id: Optional[str] = None,
         patient_id: Optional[str] = None,
         status: Optional[EncounterStatus] = None,
+        status_not: Optional[EncounterStatus] = None,
     ) -> Iterable[ClinicalEncounter]:
         raise NotImplementedError
 
+    def list_summaries_by_filters(
+        self,
+        *,
+        clinician_id: Optional[str] = None,
+        patient_id: Optional[str] = None,
+        status: Optional[EncounterStatus] = None,
+    ) -> Iterable[EncounterSummaryRow]:
+        """Like ``list_by_filters`` but only yields the summary columns.
+
+        Database-backed implementations should override this with a column
+        projection so list endpoints do not load full encounter rows.
+        """
+
+        return [
+            EncounterSummaryRow(e.id, e.created_at, e.clinician_id, e.patient_id, e.status, e.title)
+            for e in self.list_by_filters(clinician_id=clinician_id, patient_id=patient_id, status=status)
+        ]
+
     @abstractmethod
     def save(self, encounter: ClinicalEncounter) -> None:
         raise NotImplementedError
 
+    def save_many(self, encounters: Iterable[ClinicalEncounter]) -> None:
+        """Save several encounters.
+
+        Database-backed implementations should override this to write them in
+        one transaction with batched statements.
+        """
+
+        for encounter in encounters:
+            self.save(encounter)
+
 
 class ClinicalNoteRepository(ABC):
     @abstractmethod
@@ -38,12 +94,48 @@ class ClinicalNoteRepository(ABC):
     def get_by_encounter(self, encounter_id: UUID) -> Optional[ClinicalNote]:
         raise NotImplementedError
 
+    def get_by_encounters(self, encounter_ids: Iterable[UUID]) -> Dict[UUID, ClinicalNote]:
+        """Return ``{encounter_id: note}`` for those encounters that have a note.
+
+        Database-backed implementations should override this with a single
+        query so callers iterating many encounters avoid one round trip each.
+        """
+
+        notes: Dict[UUID, ClinicalNote] = {}
+        for encounter_id in encounter_ids:
+            note = self.get_by_encounter(encounter_id)
+            if note is not None:
+                notes[encounter_id] = note
+        return notes
+
+    @abstractmethod
+    def encounter_ids_with_notes(self) -> Set[UUID]:
+        """Return the IDs of all current-tenant encounters that have a note."""
+        raise NotImplementedError
+
     @abstractmethod
     def save(self, note: ClinicalNote) -> None:
         raise NotImplementedError
 
+    def save_many(self, notes: Iterable[ClinicalNote]) -> None:
+        """Save several notes; see ``EncounterRepository.save_many``."""
+
+        for note in notes:
+            self.save(note)
+
 
 class TranscriptionJobRepository(ABC):
     @abstractmethod
     def get(self, job_id: UUID) -> Optional[TranscriptJob]:
         raise NotImplementedError
+
+
+class AnalyticsRepository(ABC):
+    @abstractmethod
+    def finalization_stats(self, *, clinician_id: Optional[str] = None) -> FinalizationStats:
+        """Aggregate encounter/note counts and finalization delays.
+
+        ``pending_review`` counts unfinalized notes on READY_FOR_REVIEW
+        encounters.
+        """
+        raise NotImplementedError
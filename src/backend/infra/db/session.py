@@ -2,10 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import contextmanager
-from typing import Iterator, Protocol
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Protocol
 
 
 class SessionProtocol(Protocol):  # pragma: no cover - placeholder for real ORM session
@@ -22,6 +20,101 @@ class SessionProtocol(Protocol):  # pragma: no cover - placeholder for real ORM
 SessionFactory = Callable[[], SessionProtocol]
 
 
+# Session shared by repository calls inside ``unit_of_work``.
+_active_session: ContextVar[Optional[Any]] = ContextVar("active_session", default=None)
+# Callbacks registered with ``after_commit`` inside the active unit of work.
+_after_commit_callbacks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "after_commit_callbacks", default=None
+)
+# Factory used by ``unit_of_work``; set by init_sql_repositories.
+_default_session_factory: Optional[SessionFactory] = None
+
+
+def set_default_session_factory(session_factory: Optional[SessionFactory]) -> None:
+    global _default_session_factory
+    _default_session_factory = session_factory
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Optional[Any]]:
+    """Run the enclosed repository calls in one session and one transaction.
+
+    Saving an encounter and its note otherwise checks out two connections and
+    commits twice. The transaction commits when the block exits normally and
+    rolls back if it raises. Nested blocks join the outer unit of work. When
+    SQL repositories are not configured this is a no-op that yields ``None``.
+    """
+
+    active = _active_session.get()
+    if active is not None or _default_session_factory is None:
+        yield active
+        return
+
+    session: Any = _default_session_factory()
+    callbacks: List[Callable[[], None]] = []
+    token = _active_session.set(session)
+    callbacks_token = _after_commit_callbacks.set(callbacks)
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        _after_commit_callbacks.reset(callbacks_token)
+        _active_session.reset(token)
+        session.close()
+
+    # Only reached once the transaction has committed.
+    for callback in callbacks:
+        callback()
+
+
+@contextmanager
+def repository_session(session_factory: SessionFactory) -> Iterator[Any]:
+    """Yield the active unit-of-work session, or a new one closed on exit."""
+
+    active = _active_session.get()
+    if active is not None:
+        yield active
+        return
+
+    session: Any = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the current write is durably committed.
+
+    Inside ``unit_of_work`` the callback is deferred until the unit of work
+    commits (and dropped if it rolls back); otherwise the caller has already
+    committed and it runs immediately. Use it for cache invalidation so
+    concurrent readers cannot cache pre-commit rows as current.
+    """
+
+    callbacks = _after_commit_callbacks.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def commit(session: Any) -> None:
+    """Commit ``session`` unless a unit of work owns it.
+
+    Inside ``unit_of_work`` pending changes are only flushed; the unit of
+    work commits once on exit.
+    """
+
+    if session is _active_session.get():
+        session.flush()
+    else:
+        session.commit()
+
+
 def create_sqlalchemy_session_factory(database_url: str) -> SessionFactory:
     """Create a SQLAlchemy-backed SessionFactory.
 
@@ -30,7 +123,14 @@ def create_sqlalchemy_session_factory(database_url: str) -> SessionFactory:
     instances compatible with SessionProtocol.
     """
 
-    engine = create_engine(database_url, future=True)
+    # Imported here so that importing this module (for unit_of_work) does not
+    # load SQLAlchemy when SQL repositories are disabled.
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session, sessionmaker
+
+    # A larger compiled-statement cache than the default 500 keeps the
+    # repositories' filter permutations from evicting each other.
+    engine = create_engine(database_url, future=True, query_cache_size=1200)
     SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, class_=Session)
 
     def _factory() -> SessionProtocol:  # pragma: no cover - thin wrapper
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import and_, case, distinct, extract, func, not_, select
+
+from src.backend.domain.models.clinical_encounter import EncounterStatus
+from src.backend.infra.db.models import EncounterORM
+from src.backend.infra.db.models_notes_jobs import ClinicalNoteORM
+from src.backend.infra.db.repositories import AnalyticsRepository, FinalizationStats
+from src.backend.infra.db.session import SessionFactory, repository_session
+from src.backend.tenancy import get_current_tenant
+
+
+class SqlAnalyticsRepository(AnalyticsRepository):  # pragma: no cover - not wired yet
+    """Computes analytics aggregates in a single query.
+
+    Assumes one note per encounter, which is how notes are created; extra
+    notes for the same encounter would each be counted.
+    """
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    def finalization_stats(self, *, clinician_id: Optional[str] = None) -> FinalizationStats:
+        e = EncounterORM.__table__
+        n = ClinicalNoteORM.__table__
+        is_timed = and_(n.c.is_finalized, e.c.created_at <= n.c.updated_at)
+        # Subtract per-column epochs rather than the timestamps themselves so
+        # the expression works on SQLite as well as PostgreSQL.
+        delay = extract("epoch", n.c.updated_at) - extract("epoch", e.c.created_at)
+
+        stmt = (
+            select(
+                func.count(distinct(e.c.id)),
+                func.count(n.c.id),
+                func.sum(case((n.c.is_finalized, 1), else_=0)),
+                func.sum(case((is_timed, 1), else_=0)),
+                func.sum(case((is_timed, delay), else_=0)),
+                func.sum(
+                    case(
+                        (and_(not_(n.c.is_finalized), e.c.status == EncounterStatus.READY_FOR_REVIEW.value), 1),
+                        else_=0,
+                    )
+                ),
+            )
+            .select_from(
+                e.outerjoin(n, and_(n.c.encounter_id == e.c.id, n.c.tenant_id == e.c.tenant_id))
+            )
+            .where(e.c.tenant_id == get_current_tenant())
+        )
+        if clinician_id is not None:
+            stmt = stmt.where(e.c.clinician_id == clinician_id)
+
+        with repository_session(self._session_factory) as session:
+            encounters, notes, finalized, timed, timed_seconds, pending_review = session.execute(stmt).one()
+        # SUM over no rows is NULL.
+        return FinalizationStats(
+            encounters,
+            notes,
+            finalized or 0,
+            timed or 0,
+            float(timed_seconds or 0),
+            pending_review or 0,
+        )
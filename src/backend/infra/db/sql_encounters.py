@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
-from src.backend.infra.db.repositories import EncounterRepository
-from src.backend.infra.db.session import SessionFactory
+from sqlalchemy import insert, select, update
+
+from src.backend.core.cache import encounter_data_version
+from src.backend.domain.models.clinical_encounter import (
+    ENCOUNTER_STATUS_BY_VALUE,
+    ClinicalEncounter,
+    EncounterStatus,
+)
+from src.backend.infra.db.repositories import EncounterRepository, EncounterSummaryRow
+from src.backend.infra.db.session import SessionFactory, after_commit, commit, repository_session
 from src.backend.infra.db.models import EncounterORM
 from src.backend.tenancy import get_current_tenant
 
+# Rows fetched per round trip when streaming encounter lists.
+_LIST_BATCH_SIZE = 1000
+
 
 class SqlEncounterRepository(EncounterRepository):  # pragma: no cover - skeleton only
     """SQL-backed EncounterRepository skeleton.
@@ -28,16 +38,13 @@ class SqlEncounterRepository(EncounterRepository):  # pragma: no cover - skeleto
         Enforces tenant scoping using the current tenant context.
         """
 
-        session = self._session_factory()
-        try:
+        with repository_session(self._session_factory) as session:
             orm = session.get(EncounterORM, encounter_id)
             if orm is None:
                 return None
             if orm.tenant_id != get_current_tenant():
                 return None
             return orm.to_domain()
-        finally:
-            session.close()
 
     def list_by_filters(
         self,
@@ -45,33 +52,69 @@ class SqlEncounterRepository(EncounterRepository):  # pragma: no cover - skeleto
         clinician_id: Optional[str] = None,
         patient_id: Optional[str] = None,
         status: Optional[EncounterStatus] = None,
+        status_not: Optional[EncounterStatus] = None,
     ) -> Iterable[ClinicalEncounter]:
         """Yield ClinicalEncounter instances matching optional filters.
 
-        Results are automatically scoped to the current tenant.
+        Results are automatically scoped to the current tenant. Rows are read
+        as plain Core rows from the table, so listing skips ORM instance
+        construction and identity-map bookkeeping, and are streamed in
+        batches (server-side cursor where the driver supports it) rather
+        than fetched all at once.
         """
 
-        session = self._session_factory()
-        try:
-            current_tenant = get_current_tenant()
-            query = session.query(EncounterORM).filter(EncounterORM.tenant_id == current_tenant)
-            if clinician_id is not None:
-                query = query.filter(EncounterORM.clinician_id == clinician_id)
-            if patient_id is not None:
-                query = query.filter(EncounterORM.patient_id == patient_id)
-            if status is not None:
-                query = query.filter(EncounterORM.status == status.value)
-
-            for orm in query.all():
-                yield orm.to_domain()
-        finally:
-            session.close()
+        table = EncounterORM.__table__
+        stmt = select(table).where(table.c.tenant_id == get_current_tenant())
+        if clinician_id is not None:
+            stmt = stmt.where(table.c.clinician_id == clinician_id)
+        if patient_id is not None:
+            stmt = stmt.where(table.c.patient_id == patient_id)
+        if status is not None:
+            stmt = stmt.where(table.c.status == status.value)
+        if status_not is not None:
+            stmt = stmt.where(table.c.status != status_not.value)
+
+        with repository_session(self._session_factory) as session:
+            result = session.execute(stmt.execution_options(yield_per=_LIST_BATCH_SIZE))
+            for row in result:
+                yield EncounterORM.domain_from_row(row)
+
+    def list_summaries_by_filters(
+        self,
+        *,
+        clinician_id: Optional[str] = None,
+        patient_id: Optional[str] = None,
+        status: Optional[EncounterStatus] = None,
+    ) -> Iterable[EncounterSummaryRow]:
+        """Return summary rows using a column projection instead of full rows."""
+
+        stmt = select(
+            EncounterORM.id,
+            EncounterORM.created_at,
+            EncounterORM.clinician_id,
+            EncounterORM.patient_id,
+            EncounterORM.status,
+            EncounterORM.title,
+        ).where(EncounterORM.tenant_id == get_current_tenant())
+        if clinician_id is not None:
+            stmt = stmt.where(EncounterORM.clinician_id == clinician_id)
+        if patient_id is not None:
+            stmt = stmt.where(EncounterORM.patient_id == patient_id)
+        if status is not None:
+            stmt = stmt.where(EncounterORM.status == status.value)
+
+        with repository_session(self._session_factory) as session:
+            return [
+                EncounterSummaryRow(
+                    r.id, r.created_at, r.clinician_id, r.patient_id, ENCOUNTER_STATUS_BY_VALUE[r.status], r.title
+                )
+                for r in session.execute(stmt)
+            ]
 
     def save(self, encounter: ClinicalEncounter) -> None:
         """Insert or update a ClinicalEncounter in the database."""
 
-        session = self._session_factory()
-        try:
+        with repository_session(self._session_factory) as session:
             existing = session.get(EncounterORM, encounter.id)
             if existing is None:
                 orm = EncounterORM.from_domain(encounter)
@@ -83,11 +126,33 @@ class SqlEncounterRepository(EncounterRepository):  # pragma: no cover - skeleto
                 existing.patient_id = encounter.patient_id
                 existing.status = encounter.status.value
                 existing.title = encounter.title
-                existing.transcription_job_ids = ",".join(
-                    str(j) for j in encounter.transcription_job_ids
-                ) if encounter.transcription_job_ids else None
+                existing.transcription_job_ids = list(encounter.transcription_job_ids)
                 existing.tenant_id = encounter.tenant_id
 
-            session.commit()
-        finally:
-            session.close()
+            commit(session)
+            after_commit(encounter_data_version.bump)
+
+    def save_many(self, encounters: Iterable[ClinicalEncounter]) -> None:
+        """Insert or update several encounters in one transaction.
+
+        Existing ids are looked up with a single IN query; new rows go out as
+        one batched INSERT and existing ones as one bulk UPDATE by primary key.
+        """
+
+        # Last write wins for duplicate ids within the batch.
+        rows = list({e.id: EncounterORM.values_from_domain(e) for e in encounters}.values())
+        if not rows:
+            return
+
+        with repository_session(self._session_factory) as session:
+            existing_ids = set(
+                session.scalars(select(EncounterORM.id).where(EncounterORM.id.in_([r["id"] for r in rows])))
+            )
+            new_rows: List[dict] = [r for r in rows if r["id"] not in existing_ids]
+            updated_rows: List[dict] = [r for r in rows if r["id"] in existing_ids]
+            if new_rows:
+                session.execute(insert(EncounterORM), new_rows)
+            if updated_rows:
+                session.execute(update(EncounterORM), updated_rows)
+            commit(session)
+            after_commit(encounter_data_version.bump)
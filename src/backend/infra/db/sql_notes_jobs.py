@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from uuid import UUID
 
+from sqlalchemy import insert, select, update
+
+from src.backend.core.cache import encounter_data_version
 from src.backend.domain.models.clinical_note import ClinicalNote
 from src.backend.domain.models.transcription_job import TranscriptJob
 from src.backend.infra.db.models_notes_jobs import ClinicalNoteORM, TranscriptJobORM
 from src.backend.infra.db.repositories import ClinicalNoteRepository, TranscriptionJobRepository
-from src.backend.infra.db.session import SessionFactory
+from src.backend.infra.db.session import SessionFactory, after_commit, commit, repository_session
 from src.backend.tenancy import get_current_tenant
 
 
@@ -16,37 +19,57 @@ class SqlClinicalNoteRepository(ClinicalNoteRepository):  # pragma: no cover - n
         self._session_factory = session_factory
 
     def get(self, note_id: UUID) -> Optional[ClinicalNote]:
-        session = self._session_factory()
-        try:
+        with repository_session(self._session_factory) as session:
             orm = session.get(ClinicalNoteORM, note_id)
             if orm is None:
                 return None
             if orm.tenant_id != get_current_tenant():
                 return None
             return orm.to_domain()
-        finally:
-            session.close()
 
     def get_by_encounter(self, encounter_id: UUID) -> Optional[ClinicalNote]:
-        session = self._session_factory()
-        try:
-            current_tenant = get_current_tenant()
-            orm = (
-                session.query(ClinicalNoteORM)
-                .filter(
-                    ClinicalNoteORM.encounter_id == encounter_id,
-                    ClinicalNoteORM.tenant_id == current_tenant,
-                )
-                .order_by(ClinicalNoteORM.created_at.desc())
-                .first()
+        stmt = (
+            select(ClinicalNoteORM)
+            .where(
+                ClinicalNoteORM.encounter_id == encounter_id,
+                ClinicalNoteORM.tenant_id == get_current_tenant(),
             )
+            .order_by(ClinicalNoteORM.created_at.desc())
+            .limit(1)
+        )
+        with repository_session(self._session_factory) as session:
+            orm = session.execute(stmt).scalars().first()
             return orm.to_domain() if orm is not None else None
-        finally:
-            session.close()
+
+    def get_by_encounters(self, encounter_ids: Iterable[UUID]) -> Dict[UUID, ClinicalNote]:
+        ids = list(encounter_ids)
+        if not ids:
+            return {}
+        stmt = (
+            select(ClinicalNoteORM)
+            .where(
+                ClinicalNoteORM.encounter_id.in_(ids),
+                ClinicalNoteORM.tenant_id == get_current_tenant(),
+            )
+            .order_by(ClinicalNoteORM.created_at)
+        )
+        with repository_session(self._session_factory) as session:
+            rows = session.execute(stmt).scalars().all()
+            # Ascending order so the newest note per encounter wins, matching
+            # get_by_encounter.
+            return {orm.encounter_id: orm.to_domain() for orm in rows}
+
+    def encounter_ids_with_notes(self) -> Set[UUID]:
+        stmt = (
+            select(ClinicalNoteORM.encounter_id)
+            .where(ClinicalNoteORM.tenant_id == get_current_tenant())
+            .distinct()
+        )
+        with repository_session(self._session_factory) as session:
+            return set(session.execute(stmt).scalars())
 
     def save(self, note: ClinicalNote) -> None:
-        session = self._session_factory()
-        try:
+        with repository_session(self._session_factory) as session:
             existing = session.get(ClinicalNoteORM, note.id)
             if existing is None:
                 orm = ClinicalNoteORM.from_domain(note)
@@ -66,9 +89,27 @@ class SqlClinicalNoteRepository(ClinicalNoteRepository):  # pragma: no cover - n
                 existing.assessment = note.assessment.text
                 existing.plan = note.plan.text
                 existing.tenant_id = note.tenant_id
-            session.commit()
-        finally:
-            session.close()
+            commit(session)
+            after_commit(encounter_data_version.bump)
+
+    def save_many(self, notes: Iterable[ClinicalNote]) -> None:
+        # Same batching as SqlEncounterRepository.save_many.
+        rows = list({n.id: ClinicalNoteORM.values_from_domain(n) for n in notes}.values())
+        if not rows:
+            return
+
+        with repository_session(self._session_factory) as session:
+            existing_ids = set(
+                session.scalars(select(ClinicalNoteORM.id).where(ClinicalNoteORM.id.in_([r["id"] for r in rows])))
+            )
+            new_rows: List[dict] = [r for r in rows if r["id"] not in existing_ids]
+            updated_rows: List[dict] = [r for r in rows if r["id"] in existing_ids]
+            if new_rows:
+                session.execute(insert(ClinicalNoteORM), new_rows)
+            if updated_rows:
+                session.execute(update(ClinicalNoteORM), updated_rows)
+            commit(session)
+            after_commit(encounter_data_version.bump)
 
 
 class SqlTranscriptionJobRepository(TranscriptionJobRepository):  # pragma: no cover - not wired yet
@@ -76,13 +117,10 @@ class SqlTranscriptionJobRepository(TranscriptionJobRepository):  # pragma: no c
         self._session_factory = session_factory
 
     def get(self, job_id: UUID) -> Optional[TranscriptJob]:
-        session = self._session_factory()
-        try:
+        with repository_session(self._session_factory) as session:
             orm = session.get(TranscriptJobORM, job_id)
             if orm is None:
                 return None
             if orm.tenant_id != get_current_tenant():
                 return None
             return orm.to_domain()
-        finally:
-            session.close()
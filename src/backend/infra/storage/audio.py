@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.config import settings
 
@@ -11,6 +15,16 @@ class AudioStorageBackend(ABC):
     def save_file(self, content: bytes, *, suffix: str) -> str:
         """Persist audio bytes and return a URL/path reference."""
 
+    @abstractmethod
+    async def save_stream(self, chunks: AsyncIterator[bytes], *, suffix: str) -> str:
+        """Persist audio streamed as byte chunks and return a URL/path reference.
+
+        Used by the upload endpoint so that large files never have to be held
+        in memory in full. If ``chunks`` raises (for example because a size
+        limit was exceeded), any partially written data is discarded and the
+        exception is propagated.
+        """
+
     @abstractmethod
     def append_file(self, dest: str, chunk: bytes) -> None:
         """Append bytes to an existing audio file reference.
@@ -18,6 +32,18 @@ class AudioStorageBackend(ABC):
         Used by the WebSocket live ingestion endpoint.
         """
 
+    @abstractmethod
+    def open_append(self, dest: str, *, buffer_size: int = -1) -> BinaryIO:
+        """Open an audio file reference for repeated appends.
+
+        Long-lived writers such as the WebSocket endpoint hold the returned
+        handle for the whole session instead of calling :meth:`append_file`
+        (open/seek/write/close) per chunk. A large ``buffer_size`` coalesces
+        many small writes into few syscalls; callers must ``flush()`` before
+        anything else reads the file. Callers own the handle and must close
+        it.
+        """
+
     @abstractmethod
     def delete_file(self, dest: str) -> None:
         """Best-effort deletion of a previously saved file."""
@@ -29,16 +55,50 @@ class LocalAudioStorageBackend(AudioStorageBackend):
         self._base.mkdir(parents=True, exist_ok=True)
 
     def save_file(self, content: bytes, *, suffix: str) -> str:
-        self._base.mkdir(parents=True, exist_ok=True)
         dest_path = self._base / suffix
-        dest_path.write_bytes(content)
+        try:
+            dest_path.write_bytes(content)
+        except FileNotFoundError:
+            # The upload directory was removed after startup; recreate it.
+            self._base.mkdir(parents=True, exist_ok=True)
+            dest_path.write_bytes(content)
+        return str(dest_path)
+
+    async def save_stream(self, chunks: AsyncIterator[bytes], *, suffix: str) -> str:
+        dest_path = self._base / suffix
+        # File I/O runs in the threadpool so a slow disk never stalls the
+        # event loop while a large upload is being written.
+        out = await run_in_threadpool(dest_path.open, "wb")
+        try:
+            async for chunk in chunks:
+                await run_in_threadpool(out.write, chunk)
+        except BaseException:
+            out.close()
+            self.delete_file(str(dest_path))
+            raise
+        await run_in_threadpool(out.close)
         return str(dest_path)
 
     def append_file(self, dest: str, chunk: bytes) -> None:
+        # Unbuffered O_APPEND write; the parent directory is only created when
+        # the open fails, not checked on every chunk.
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            fd = os.open(dest, flags, 0o666)
+        except FileNotFoundError:
+            Path(dest).parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(dest, flags, 0o666)
+        try:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def open_append(self, dest: str, *, buffer_size: int = -1) -> BinaryIO:
         path = Path(dest)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("ab") as f:
-            f.write(chunk)
+        return path.open("ab", buffering=buffer_size)
 
     def delete_file(self, dest: str) -> None:
         path = Path(dest)
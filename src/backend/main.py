@@ -1,5 +1,9 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from src.backend.api.v1.routes_system import router as system_router_v1
 from src.backend.api.v1.routes_transcription import router as transcription_router_v1
@@ -15,30 +19,38 @@ from src.backend.api.v1.routes_scribe import router as scribe_router_v1
 from src.backend.api.v1.routes_culture import router as culture_router_v1
 from src.backend.config import settings
 from src.backend.infra.db.bootstrap import init_sql_repositories
+from src.backend.services.audit.service import audit_service
+from src.backend.services.nlp.service import nlp_service
 
-app = FastAPI(title="AI Medical Transcription Detector API")
-
-
-@app.on_event("startup")
-async def startup_event():
-    pass # Replace with actual lifespan context manager later
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    pass # Add shutdown logic if needed
-    """Application startup hook.
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application startup/shutdown hook.
 
     When USE_SQL_REPOS is enabled and a DATABASE_URL is configured, this will
     initialize SQL-backed repositories for encounters, notes, and
     transcription jobs. In other environments (tests, local dev without a
     database), this is a no-op and the in-memory repositories remain active.
+
+    The audit flusher is started for the lifetime of the app and drained on
+    shutdown so no queued audit events are lost, and the NLP pipeline is
+    warmed up so the first analysis request does not pay model load time.
     """
 
     init_sql_repositories()
+    await run_in_threadpool(nlp_service.warmup)
+    audit_service.start()
+    try:
+        yield
+    finally:
+        audit_service.stop()
+
+
+app = FastAPI(title="AI Medical Transcription Detector API", lifespan=lifespan)
 
 # CORS configuration – permissive by default for development. Tighten via
 # CORS_ALLOW_ORIGINS in production deployments.
-allow_origins = [origin.strip() for origin in settings.cors_allow_origins.split(",") if origin.strip()] or ["*"]
+allow_origins = list(settings.cors_allow_origins_list) or ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import hashlib
 from contextvars import ContextVar
-from typing import List, Optional
+from typing import Dict, Optional
 
 from fastapi import Depends, HTTPException, Security, status
+from starlette.requests import HTTPConnection
 
 from src.backend.domain.models.user import User, UserRole
 from src.backend.services.users.service import user_service
@@ -12,8 +13,19 @@ from fastapi.security import APIKeyHeader
 
 from src.backend.config import settings
 
+class _ConnectionAPIKeyHeader(APIKeyHeader):
+    """APIKeyHeader that also resolves for WebSocket routes.
+
+    The stock implementation is typed against ``Request`` which FastAPI cannot
+    inject into WebSocket endpoints; ``HTTPConnection`` covers both.
+    """
+
+    async def __call__(self, request: HTTPConnection) -> Optional[str]:  # type: ignore[override]
+        return request.headers.get(self.model.name) or None
+
+
 # API key is expected in this header when ENABLE_API_AUTH is true.
-_api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+_api_key_header = _ConnectionAPIKeyHeader(name="X-API-Key", auto_error=False)
 
 # Context variable storing a stable, non-raw identifier for the current caller
 # (e.g., a hashed API key). This allows downstream consumers such as the
@@ -22,6 +34,24 @@ _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 _current_subject: ContextVar[Optional[str]] = ContextVar("current_subject", default=None)
 
 
+def _subject_for_key(api_key: str) -> str:
+    # Derive a non-reversible, stable identifier from the API key for use as a
+    # "subject" in audit logs and similar features. This avoids logging the
+    # raw secret while still letting us correlate actions by the same caller.
+    return "api-key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _key_digest(api_key: str) -> bytes:
+    return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+
+# Settings are frozen, so the configured keys and their subjects are derived
+# once. Lookups go by SHA-256 digest rather than the raw key: comparing
+# digests reveals nothing about how much of a guessed key matched, giving
+# the timing safety of hmac.compare_digest with a single dict probe.
+_API_KEY_SUBJECTS: Dict[bytes, str] = {_key_digest(key): _subject_for_key(key) for key in settings.api_keys_set}
+
+
 def get_current_subject() -> Optional[str]:
     """Return the current subject identifier, if any.
 
@@ -33,18 +63,6 @@ def get_current_subject() -> Optional[str]:
     return _current_subject.get()
 
 
-def _parse_api_keys() -> List[str]:
-    """Return the configured API keys as a normalized list.
-
-    API_KEYS is treated as a comma-separated list. Whitespace is stripped and
-    empty entries are ignored.
-    """
-
-    if not settings.api_keys:
-        return []
-    return [key.strip() for key in settings.api_keys.split(",") if key.strip()]
-
-
 async def get_api_key(api_key: Optional[str] = Security(_api_key_header)) -> str:
     """FastAPI dependency for simple API-key based authentication.
 
@@ -61,24 +79,20 @@ async def get_api_key(api_key: Optional[str] = Security(_api_key_header)) -> str
         _current_subject.set(None)
         return ""
 
-    allowed_keys = _parse_api_keys()
-    if not allowed_keys:
+    if not _API_KEY_SUBJECTS:
         # Misconfiguration: auth is enabled but no keys are configured.
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="API authentication is enabled but no API keys are configured.",
         )
 
-    if not api_key or api_key not in allowed_keys:
+    subject_id = _API_KEY_SUBJECTS.get(_key_digest(api_key)) if api_key else None
+    if subject_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key.",
         )
 
-    # Derive a non-reversible, stable identifier from the API key for use as a
-    # "subject" in audit logs and similar features. This avoids logging the
-    # raw secret while still letting us correlate actions by the same caller.
-    subject_id = "api-key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
     _current_subject.set(subject_id)
 
     return api_key
@@ -143,6 +157,9 @@ def ensure_can_edit_encounter(user: User, clinician_id: Optional[str]) -> None:
     ensure_can_view_encounter(user, clinician_id)
 
 
+_SCRIBE_PANEL_ROLES = frozenset({UserRole.ADMIN, UserRole.SCRIBE})
+
+
 def ensure_is_scribe_or_admin(user: User) -> None:
     """Raise HTTP 403 if the user is not a scribe or admin.
 
@@ -150,7 +167,7 @@ def ensure_is_scribe_or_admin(user: User) -> None:
     scribes and administrators.
     """
 
-    if user.role in {UserRole.ADMIN, UserRole.SCRIBE}:
+    if user.role in _SCRIBE_PANEL_ROLES:
         return
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
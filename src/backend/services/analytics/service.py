@@ -1,74 +1,71 @@
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import Optional
 
+from src.backend.config import settings
+from src.backend.core.cache import TTLCache, encounter_data_version
 from src.backend.domain.models.analytics import ClinicOverviewMetrics, ClinicianSummaryMetrics
-from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
-from src.backend.infra.db.inmemory import encounter_repository, clinical_note_repository
+from src.backend.infra.db import inmemory as repos
+from src.backend.infra.db.repositories import FinalizationStats
+from src.backend.tenancy import get_current_tenant
 
 
 class AnalyticsService:
+    """Clinic and clinician metrics derived from encounter/note aggregates.
+
+    Aggregation is delegated to the analytics repository (looked up at call
+    time because init_sql_repositories swaps it on startup). Aggregates are
+    cached per ``(tenant, clinician_id)`` together with
+    ``encounter_data_version``, so any committed write in this process
+    invalidates them;
+    the TTL bounds staleness from other processes.
+    """
+
+    def __init__(self) -> None:
+        self._cache: TTLCache[FinalizationStats] = TTLCache(
+            maxsize=settings.analytics_cache_maxsize,
+            ttl_seconds=settings.analytics_cache_ttl_seconds,
+        )
+
+    def _stats(self, clinician_id: Optional[str] = None) -> FinalizationStats:
+        key = (get_current_tenant(), clinician_id, encounter_data_version.value)
+        stats = self._cache.get(key)
+        if stats is None:
+            stats = repos.analytics_repository.finalization_stats(clinician_id=clinician_id)
+            self._cache.set(key, stats)
+        return stats
+
     def compute_clinic_overview(self) -> ClinicOverviewMetrics:
-        encounters = list(encounter_repository.list_by_filters())
-        total_encounters = len(encounters)
-
-        notes = []
-        finalized_durations: list[timedelta] = []
-        finalized_count = 0
-
-        for enc in encounters:
-            note = clinical_note_repository.get_by_encounter(enc.id)
-            if note is None:
-                continue
-            notes.append(note)
-            if note.is_finalized and enc.created_at <= note.updated_at:
-                finalized_count += 1
-                finalized_durations.append(note.updated_at - enc.created_at)
-
-        total_notes = len(notes)
+        stats = self._stats()
+
         avg_minutes: Optional[float] = None
         finalized_rate: Optional[float] = None
 
-        if finalized_durations:
-            avg_minutes = sum((d.total_seconds() for d in finalized_durations)) / 60.0 / len(finalized_durations)
-        if total_notes:
-            finalized_rate = finalized_count / total_notes
+        if stats.timed:
+            avg_minutes = stats.timed_seconds / 60.0 / stats.timed
+        if stats.notes:
+            finalized_rate = stats.timed / stats.notes
 
         return ClinicOverviewMetrics(
-            total_encounters=total_encounters,
-            total_notes=total_notes,
-            finalized_notes=finalized_count,
+            total_encounters=stats.encounters,
+            total_notes=stats.notes,
+            finalized_notes=stats.timed,
             avg_time_to_finalize_minutes=avg_minutes,
             finalized_rate=finalized_rate,
         )
 
     def compute_clinician_summary(self, clinician_id: str) -> ClinicianSummaryMetrics:
-        encounters = list(encounter_repository.list_by_filters(clinician_id=clinician_id))
-        notes_finalized = 0
-        notes_pending = 0
-        durations: list[timedelta] = []
-
-        for enc in encounters:
-            note = clinical_note_repository.get_by_encounter(enc.id)
-            if note is None:
-                continue
-            if note.is_finalized:
-                notes_finalized += 1
-                if enc.created_at <= note.updated_at:
-                    durations.append(note.updated_at - enc.created_at)
-            elif enc.status == EncounterStatus.READY_FOR_REVIEW:
-                notes_pending += 1
+        stats = self._stats(clinician_id)
 
         avg_delay: Optional[float] = None
-        if durations:
-            avg_delay = sum((d.total_seconds() for d in durations)) / 60.0 / len(durations)
+        if stats.timed:
+            avg_delay = stats.timed_seconds / 60.0 / stats.timed
 
         return ClinicianSummaryMetrics(
             clinician_id=clinician_id,
-            encounters_count=len(encounters),
-            notes_finalized=notes_finalized,
-            notes_pending_review=notes_pending,
+            encounters_count=stats.encounters,
+            notes_finalized=stats.finalized,
+            notes_pending_review=stats.pending_review,
             avg_finalization_delay_minutes=avg_delay,
         )
 
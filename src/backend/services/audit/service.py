@@ -1,17 +1,51 @@
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import dataclass, asdict
+import queue
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import orjson
 
 from src.backend.config import settings
+from src.backend.security import get_current_subject
+from src.backend.services.blockchain.multichain import get_multichain_client
 
 logger = logging.getLogger("audit")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class EncounterAuditExtra:
+    """Typed ``extra`` payload for clinical encounter audit events.
+
+    Encounter routes log the same handful of keys on every request; a slotted
+    instance is cheaper than a fresh dict and is only expanded into one when
+    the event is actually written. Unset (``None``) fields are omitted from
+    the written payload.
+    """
+
+    user_id: str
+    role: str
+    status: Optional[str] = None
+    count: Optional[int] = None
+    finalize: Optional[bool] = None
+    suggestion_count: Optional[int] = None
+    enabled: Optional[bool] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
+AuditExtra = Union[Dict[str, Any], EncounterAuditExtra]
+
+
+@dataclass(slots=True)
 class AuditEvent:
     """Structured representation of an audit event.
 
@@ -24,10 +58,43 @@ class AuditEvent:
     resource_type: str
     resource_id: Optional[str] = None
     subject: Optional[str] = None
-    extra: Optional[Dict[str, Any]] = None
+    extra: Optional[AuditExtra] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the JSON-ready dict written to logs and MultiChain."""
+
+        extra = self.extra
+        if isinstance(extra, EncounterAuditExtra):
+            extra = extra.as_dict()
+        return {
+            "timestamp": self.timestamp,
+            "action": self.action,
+            "resource_type": self.resource_type,
+            "resource_id": self.resource_id,
+            "subject": self.subject,
+            "extra": extra,
+        }
+
+
+# Sentinel placed on the queue to ask the flusher thread to drain and exit.
+_STOP = object()
 
 
 class AuditService:
+    """Structured audit logger.
+
+    Events are written inline by default. When :meth:`start` has been called
+    (the API does this in its lifespan) events are queued and a background
+    thread writes them in batches of up to ``AUDIT_BATCH_MAX_EVENTS``, waiting
+    at most ``AUDIT_BATCH_INTERVAL_MS`` for a batch to fill. The queue holds
+    at most ``AUDIT_QUEUE_MAXSIZE`` events; when it is full events are written
+    inline rather than dropped.
+    """
+
+    def __init__(self) -> None:
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+
     def log_event(
         self,
         *,
@@ -35,7 +102,7 @@ class AuditService:
         resource_type: str,
         resource_id: Optional[str] = None,
         subject: Optional[str] = None,
-        extra: Optional[Dict[str, Any]] = None,
+        extra: Optional[AuditExtra] = None,
     ) -> None:
         """Log a structured audit event.
 
@@ -45,19 +112,14 @@ class AuditService:
         - `subject`: optional identifier for the caller (e.g., API key- or
           user-derived). If omitted, we attempt to infer it from the current
           security context (when API auth is enabled).
-        - `extra`: optional small dict of non-PHI metadata (counts, flags).
+        - `extra`: optional small dict (or typed extra such as
+          ``EncounterAuditExtra``) of non-PHI metadata (counts, flags).
         """
 
         if subject is None:
-            # Best-effort subject inference from the security layer. This keeps
-            # audit logging decoupled from specific auth mechanisms while still
-            # allowing correlation of actions by the same caller.
-            try:
-                from src.backend.security import get_current_subject
-
-                subject = get_current_subject()
-            except Exception:
-                subject = None
+            # Best-effort subject inference from the security layer so actions
+            # by the same caller can be correlated.
+            subject = get_current_subject()
 
         event = AuditEvent(
             timestamp=datetime.now(timezone.utc).isoformat(),
@@ -68,30 +130,104 @@ class AuditService:
             extra=extra,
         )
 
+        if self._queue is not None:
+            # Batched mode: the request only pays for an enqueue; the flusher
+            # thread builds the payloads and performs the actual writes.
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                pass
+        self._write_batch([event])
+
+    def start(self) -> None:
+        """Start the background flusher that batches audit writes.
+
+        Until this is called (e.g. in tests or scripts that never run the
+        FastAPI lifespan) events are written inline by ``log_event``.
+        """
+
+        if self._thread is not None:
+            return
+        self._queue = queue.Queue(maxsize=settings.audit_queue_maxsize)
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush any pending events and stop the background flusher."""
+
+        if self._thread is None or self._queue is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+
+    def _run(self) -> None:
+        assert self._queue is not None
+        q = self._queue
+        max_events = settings.audit_batch_max_events
+        interval_s = settings.audit_batch_interval_ms / 1000.0
+        while True:
+            item = q.get()
+            stopping = item is _STOP
+            batch: List[AuditEvent] = [] if stopping else [item]
+            # Wait briefly for more events so they can be written together.
+            while not stopping and len(batch) < max_events:
+                try:
+                    item = q.get(timeout=interval_s)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if stopping:
+                # Drain whatever is left so shutdown never drops events.
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _STOP:
+                        batch.append(item)
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:  # pragma: no cover - defensive
+                    logger.exception("Failed to write audit batch")
+            if stopping:
+                return
+
+    def _write_batch(self, events: List[AuditEvent]) -> None:
+        batch = [event.to_payload() for event in events]
         # Always log to the local structured logger first.
-        try:
-            payload = asdict(event)
-            logger.info(json.dumps(payload))
-        except TypeError:
-            # Fallback: log a simpler representation if something in extra is
-            # not JSON serializable.
-            safe_event = asdict(event)
-            safe_event["extra"] = None
-            payload = safe_event
-            logger.info(json.dumps(safe_event))
-
-        # Optionally mirror the audit event into a MultiChain stream when
+        if settings.audit_log_structured:
+            # The handler serializes the record; encoding here would be
+            # redundant.
+            for payload in batch:
+                logger.info("audit_event", extra={"audit": payload})
+        elif logger.isEnabledFor(logging.INFO):
+            for payload in batch:
+                try:
+                    logger.info(orjson.dumps(payload).decode())
+                except TypeError:
+                    # Fallback: log a simpler representation if something in
+                    # extra is not JSON serializable (orjson.JSONEncodeError is
+                    # a TypeError).
+                    payload["extra"] = None
+                    logger.info(orjson.dumps(payload).decode())
+
+        # Optionally mirror the audit events into a MultiChain stream when
         # enabled. Any failures here are non-fatal and only logged, so audit
         # logging never breaks the main request flow.
         if settings.multichain_enabled:
             try:
-                from src.backend.services.blockchain.multichain import get_multichain_client
-
                 client = get_multichain_client()
                 if client is not None:
-                    client.publish_audit_event(payload)
+                    client.publish_audit_events(batch)
             except Exception:
-                logger.exception("Failed to publish audit event to MultiChain")
+                logger.exception("Failed to publish audit events to MultiChain")
 
 
 audit_service = AuditService()
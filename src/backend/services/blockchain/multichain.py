@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from threading import Lock
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-import httpx
+import orjson
 
 from src.backend.config import settings
 
@@ -65,7 +65,25 @@ class MultiChainClient:
 
     def __init__(self, config: MultiChainConfig) -> None:
         self._config = config
-        self._client = httpx.Client(timeout=config.timeout_seconds)
+        # Only needed when MultiChain mirroring is enabled; keep it off the
+        # API's import path.
+        import httpx
+
+        # One long-lived, pooled client: audit events are published on most
+        # requests, so reusing keep-alive connections avoids a TCP (and TLS)
+        # handshake per event.
+        self._client = httpx.Client(
+            timeout=config.timeout_seconds,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0),
+            transport=httpx.HTTPTransport(retries=1),
+            # Bodies are pre-encoded with orjson in _rpc.
+            headers={"Content-Type": "application/json"},
+        )
+        self._url = config.base_url
+        # Whether the node supports ``publishmulti`` (MultiChain 2.0+);
+        # detected from ``getinfo`` on the first batched publish.
+        self._supports_publishmulti: Optional[bool] = None
+        self._auth = (config.rpc_user, config.rpc_password) if config.rpc_user and config.rpc_password else None
 
     def _rpc(self, method: str, params: list[Any]) -> Optional[Dict[str, Any]]:
         payload: Dict[str, Any] = {
@@ -75,12 +93,8 @@ class MultiChainClient:
             "params": params,
         }
 
-        auth = None
-        if self._config.rpc_user and self._config.rpc_password:
-            auth = (self._config.rpc_user, self._config.rpc_password)
-
         try:
-            response = self._client.post(self._config.base_url, json=payload, auth=auth)
+            response = self._client.post(self._url, content=orjson.dumps(payload), auth=self._auth)
         except Exception:
             logger.exception("Error calling MultiChain RPC method %s", method)
             return None
@@ -144,9 +158,55 @@ class MultiChainClient:
 
         self._rpc("publish", params)
 
+    def publish_audit_events(self, payloads: List[Dict[str, Any]]) -> None:
+        """Publish several audit events into the configured stream.
 
-_client_lock: Lock = Lock()
-_client_instance: Optional[MultiChainClient] = None
+        Uses a single ``publishmulti`` call when the node supports it, so a
+        batch of events costs one RPC round-trip instead of one per event.
+        Older nodes (or a failed version check) fall back to per-event
+        ``publish``. Keys follow the same rule as :meth:`publish_audit_event`.
+        """
+
+        if not self._config.enabled or not payloads:
+            return
+
+        if len(payloads) == 1 or not self._publishmulti_supported():
+            for payload in payloads:
+                self.publish_audit_event(payload)
+            return
+
+        items = [
+            {"key": str(payload.get("resource_type") or "audit"), "data": {"json": payload}}
+            for payload in payloads
+        ]
+        self._rpc("publishmulti", [self._config.audit_stream, items])
+
+    def _publishmulti_supported(self) -> bool:
+        if self._supports_publishmulti is None:
+            info = self.get_info()
+            if info is None:
+                # Node unreachable; retry the check on the next batch.
+                return False
+            try:
+                major = int(str(info.get("version", "")).split(".")[0])
+            except ValueError:
+                major = 0
+            self._supports_publishmulti = major >= 2
+        return self._supports_publishmulti
+
+
+@lru_cache(maxsize=1)
+def _build_multichain_client() -> Optional[MultiChainClient]:
+    # Cached, including a ``None`` result, so a misconfigured node is reported
+    # once instead of on every audit event.
+    cfg = MultiChainConfig.from_settings()
+    if not cfg.rpc_user or not cfg.rpc_password:
+        logger.error(
+            "MULTICHAIN_ENABLED is true but RPC credentials are missing; "
+            "skipping MultiChain client initialization.",
+        )
+        return None
+    return MultiChainClient(cfg)
 
 
 def get_multichain_client() -> Optional[MultiChainClient]:
@@ -157,22 +217,4 @@ def get_multichain_client() -> Optional[MultiChainClient]:
     call from within request handlers or services.
     """
 
-    if not settings.multichain_enabled:
-        return None
-
-    global _client_instance
-    if _client_instance is not None:
-        return _client_instance
-
-    with _client_lock:
-        if _client_instance is None:
-            cfg = MultiChainConfig.from_settings()
-            if not cfg.rpc_user or not cfg.rpc_password:
-                logger.error(
-                    "MULTICHAIN_ENABLED is true but RPC credentials are missing; "
-                    "skipping MultiChain client initialization.",
-                )
-                return None
-            _client_instance = MultiChainClient(cfg)
-
-    return _client_instance
+    return _build_multichain_client() if settings.multichain_enabled else None
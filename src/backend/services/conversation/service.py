@@ -16,7 +16,9 @@ class InMemoryConversationService:
     """
 
     def __init__(self) -> None:
-        self._sessions: Dict[UUID, ConversationSession] = {}
+        # tenant_id -> session_id -> session, so lookups never see (or scan)
+        # other tenants' sessions.
+        self._sessions_by_tenant: Dict[str, Dict[UUID, ConversationSession]] = {}
 
     def create_session(self, title: Optional[str] = None) -> ConversationSession:
         session_id = uuid4()
@@ -26,24 +28,18 @@ class InMemoryConversationService:
             title=title,
             tenant_id=get_current_tenant(),
         )
-        self._sessions[session_id] = session
+        self._sessions_by_tenant.setdefault(session.tenant_id, {})[session_id] = session
         return session
 
     def get_session(self, session_id: UUID) -> Optional[ConversationSession]:
-        session = self._sessions.get(session_id)
-        if session is None:
-            return None
-        if session.tenant_id != get_current_tenant():
-            return None
-        return session
+        return self._sessions_by_tenant.get(get_current_tenant(), {}).get(session_id)
 
     def attach_job(self, session_id: UUID, job_id: UUID) -> ConversationSession:
-        session = self._sessions[session_id]
-        if session.tenant_id != get_current_tenant():
-            raise KeyError("Session does not belong to current tenant")
+        session = self.get_session(session_id)
+        if session is None:
+            raise KeyError("Session not found for current tenant")
         if job_id not in session.transcription_job_ids:
             session.transcription_job_ids.append(job_id)
-            self._sessions[session_id] = session
         return session
 
 
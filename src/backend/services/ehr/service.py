@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
 from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote
@@ -21,24 +21,6 @@ class DemoFHIRExporter:
         entities: ClinicalEntities,
         soap_note: SOAPNote,
     ) -> Dict[str, Any]:
-        conditions = [
-            {
-                "resourceType": "Condition",
-                "code": {
-                    "text": e.text,
-                    "coding": ([{"code": e.code}] if e.code else []),
-                },
-            }
-            for e in entities.diagnoses
-        ]
-        medications = [
-            {
-                "resourceType": "MedicationStatement",
-                "medicationCodeableConcept": {"text": e.text},
-            }
-            for e in entities.medications
-        ]
-
         composition = {
             "resourceType": "Composition",
             "status": "final",
@@ -51,7 +33,30 @@ class DemoFHIRExporter:
             ],
         }
 
-        entries = [{"resource": composition}] + [{"resource": r} for r in conditions + medications]
+        # Build the entry list in one pass instead of concatenating
+        # intermediate per-resource lists.
+        entries: List[Dict[str, Any]] = [{"resource": composition}]
+        entries.extend(
+            {
+                "resource": {
+                    "resourceType": "Condition",
+                    "code": {
+                        "text": e.text,
+                        "coding": ([{"code": e.code}] if e.code else []),
+                    },
+                }
+            }
+            for e in entities.diagnoses
+        )
+        entries.extend(
+            {
+                "resource": {
+                    "resourceType": "MedicationStatement",
+                    "medicationCodeableConcept": {"text": e.text},
+                }
+            }
+            for e in entities.medications
+        )
 
         bundle: Dict[str, Any] = {
             "resourceType": "Bundle",
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Optional
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
+from src.backend.core.cache import encounter_data_version
+from src.backend.domain.models.clinical_encounter import PRE_REVIEW_STATUSES, ClinicalEncounter, EncounterStatus
 from src.backend.domain.models.clinical_note import ClinicalNote, ClinicalNoteSection
 from src.backend.tenancy import get_current_tenant
 
@@ -17,8 +18,21 @@ class InMemoryEncounterService:
     """
 
     def __init__(self) -> None:
-        self._encounters: Dict[UUID, ClinicalEncounter] = {}
-        self._notes: Dict[UUID, ClinicalNote] = {}
+        # tenant_id -> encounters in insertion order. Point lookups use the
+        # current tenant's partition, so no post-lookup tenant check is
+        # needed, and tenant-scoped listings never walk other tenants' rows.
+        self._encounters_by_tenant: Dict[str, Dict[UUID, ClinicalEncounter]] = {}
+        # (tenant_id, clinician_id|patient_id) -> encounter ids (dicts used as
+        # ordered sets). Both fields are fixed at creation, so filtered
+        # listings only visit the matching subset.
+        self._encounter_ids_by_clinician: Dict[Tuple[str, str], Dict[UUID, None]] = {}
+        self._encounter_ids_by_patient: Dict[Tuple[str, str], Dict[UUID, None]] = {}
+        # tenant_id -> note_id -> note, partitioned like encounters.
+        self._notes_by_tenant: Dict[str, Dict[UUID, ClinicalNote]] = {}
+        # encounter_id -> note_id, so note-by-encounter lookups avoid a scan.
+        self._note_ids_by_encounter: Dict[UUID, UUID] = {}
+        # job_id -> encounter_id, so find_encounter_for_job avoids a scan.
+        self._encounter_ids_by_job: Dict[UUID, UUID] = {}
 
     # Encounters
 
@@ -39,45 +53,83 @@ class InMemoryEncounterService:
             status=EncounterStatus.CREATED,
             tenant_id=get_current_tenant(),
         )
-        self._encounters[encounter_id] = encounter
+        self.store_encounter(encounter)
+        encounter_data_version.bump()
         return encounter
 
     def get_encounter(self, encounter_id: UUID) -> Optional[ClinicalEncounter]:
-        enc = self._encounters.get(encounter_id)
-        if enc is None:
-            return None
-        if enc.tenant_id != get_current_tenant():
-            return None
-        return enc
+        return self._encounters_by_tenant.get(get_current_tenant(), {}).get(encounter_id)
 
     def attach_job(self, encounter_id: UUID, job_id: UUID) -> ClinicalEncounter:
-        encounter = self._encounters[encounter_id]
-        if encounter.tenant_id != get_current_tenant():
-            raise KeyError("Encounter does not belong to current tenant")
+        encounter = self.get_encounter(encounter_id)
+        if encounter is None:
+            raise KeyError("Encounter not found for current tenant")
         if job_id not in encounter.transcription_job_ids:
             encounter.transcription_job_ids.append(job_id)
             if encounter.status == EncounterStatus.CREATED:
                 encounter.status = EncounterStatus.IN_PROGRESS
-            self._encounters[encounter_id] = encounter
+            self.store_encounter(encounter)
+            encounter_data_version.bump()
         return encounter
 
-    # Notes
+    def store_encounter(self, encounter: ClinicalEncounter) -> None:
+        """Store ``encounter`` and index it by tenant and transcription job.
 
-    def find_encounter_for_job(self, job_id: UUID) -> Optional[ClinicalEncounter]:
-        """Return the first encounter that references the given transcription job.
+        As with notes, the first encounter a job was attached to stays the
+        one returned by :meth:`find_encounter_for_job`.
+        """
+
+        tenant_id = encounter.tenant_id
+        self._encounters_by_tenant.setdefault(tenant_id, {})[encounter.id] = encounter
+        if encounter.clinician_id is not None:
+            self._encounter_ids_by_clinician.setdefault((tenant_id, encounter.clinician_id), {})[encounter.id] = None
+        if encounter.patient_id is not None:
+            self._encounter_ids_by_patient.setdefault((tenant_id, encounter.patient_id), {})[encounter.id] = None
+        for job_id in encounter.transcription_job_ids:
+            self._encounter_ids_by_job.setdefault(job_id, encounter.id)
 
-        This helper is intentionally simple and linear over the small in-memory
-        store; a persistence-backed implementation would use a proper index or
-        join instead.
+    def list_encounters_for_tenant(
+        self,
+        tenant_id: str,
+        *,
+        clinician_id: Optional[str] = None,
+        patient_id: Optional[str] = None,
+    ) -> Iterable[ClinicalEncounter]:
+        """Return a snapshot of candidate encounters for a tenant in insertion order.
+
+        The result is a list, not a live view, so callers that iterate slowly
+        (e.g. streamed responses) are unaffected by concurrent creates. When ``clinician_id``/``patient_id`` are given only the smaller of the
+        matching index entries is visited. The result is a superset if an
+        encounter was re-saved with different ids, so callers still apply
+        their filters to each row.
         """
 
-        current_tenant = get_current_tenant()
-        for encounter in self._encounters.values():
-            if encounter.tenant_id != current_tenant:
-                continue
-            if job_id in encounter.transcription_job_ids:
-                return encounter
-        return None
+        encounters = self._encounters_by_tenant.get(tenant_id, {})
+        candidates: List[Dict[UUID, None]] = []
+        if clinician_id is not None:
+            candidates.append(self._encounter_ids_by_clinician.get((tenant_id, clinician_id), {}))
+        if patient_id is not None:
+            candidates.append(self._encounter_ids_by_patient.get((tenant_id, patient_id), {}))
+        if not candidates:
+            return list(encounters.values())
+        ids = min(candidates, key=len)
+        return [encounters[encounter_id] for encounter_id in ids]
+
+    # Notes
+
+    def find_encounter_for_job(self, job_id: UUID) -> Optional[ClinicalEncounter]:
+        """Return the first encounter that references the given transcription job."""
+
+        encounter_id = self._encounter_ids_by_job.get(job_id)
+        if encounter_id is None:
+            return None
+        encounter = self.get_encounter(encounter_id)
+        if encounter is None:
+            return None
+        # Saves may replace an encounter's job list; ignore stale index entries.
+        if job_id not in encounter.transcription_job_ids:
+            return None
+        return encounter
 
     def upsert_note_from_soap(
         self,
@@ -91,8 +143,10 @@ class InMemoryEncounterService:
         finalize: bool = False,
     ) -> ClinicalNote:
         now = datetime.now(timezone.utc)
+        # Resolved once and reused for the note and encounter lookups below.
+        tenant_id = get_current_tenant()
 
-        existing = self._find_note_for_encounter(encounter_id)
+        existing = self._find_note_for_encounter(encounter_id, tenant_id=tenant_id)
         if existing is None:
             note_id = uuid4()
             note = ClinicalNote(
@@ -107,7 +161,7 @@ class InMemoryEncounterService:
                 objective=ClinicalNoteSection(text=objective),
                 assessment=ClinicalNoteSection(text=assessment),
                 plan=ClinicalNoteSection(text=plan),
-                tenant_id=get_current_tenant(),
+                tenant_id=tenant_id,
             )
         else:
             note = existing
@@ -119,35 +173,46 @@ class InMemoryEncounterService:
             note.assessment.text = assessment
             note.plan.text = plan
 
-        self._notes[note.id] = note
+        self.store_note(note)
 
         # Optionally advance encounter status when a note exists
-        encounter = self._encounters.get(encounter_id)
+        encounter = self._encounters_by_tenant.get(tenant_id, {}).get(encounter_id)
         if encounter is not None:
             if finalize:
                 encounter.status = EncounterStatus.FINALIZED
-            elif encounter.status in {EncounterStatus.CREATED, EncounterStatus.IN_PROGRESS}:
+            elif encounter.status in PRE_REVIEW_STATUSES:
                 encounter.status = EncounterStatus.READY_FOR_REVIEW
-            self._encounters[encounter_id] = encounter
 
+        encounter_data_version.bump()
         return note
 
+    def store_note(self, note: ClinicalNote) -> None:
+        """Store ``note`` and index it by encounter.
+
+        The first note stored for an encounter stays the one returned by
+        encounter lookups, matching the previous insertion-order scan.
+        """
+
+        self._notes_by_tenant.setdefault(note.tenant_id, {})[note.id] = note
+        self._note_ids_by_encounter.setdefault(note.encounter_id, note.id)
+
     def get_note(self, note_id: UUID) -> Optional[ClinicalNote]:
-        note = self._notes.get(note_id)
-        if note is None:
-            return None
-        if note.tenant_id != get_current_tenant():
-            return None
-        return note
+        return self._notes_by_tenant.get(get_current_tenant(), {}).get(note_id)
 
-    def _find_note_for_encounter(self, encounter_id: UUID) -> Optional[ClinicalNote]:
-        current_tenant = get_current_tenant()
-        for note in self._notes.values():
-            if note.tenant_id != current_tenant:
-                continue
-            if note.encounter_id == encounter_id:
-                return note
-        return None
+    def list_notes_for_tenant(self, tenant_id: str) -> Iterable[ClinicalNote]:
+        """Return a tenant's notes in insertion order."""
+
+        return self._notes_by_tenant.get(tenant_id, {}).values()
+
+    def _find_note_for_encounter(
+        self, encounter_id: UUID, *, tenant_id: Optional[str] = None
+    ) -> Optional[ClinicalNote]:
+        note_id = self._note_ids_by_encounter.get(encounter_id)
+        if note_id is None:
+            return None
+        if tenant_id is None:
+            tenant_id = get_current_tenant()
+        return self._notes_by_tenant.get(tenant_id, {}).get(note_id)
 
 
 encounter_service = InMemoryEncounterService()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping, Optional
 
 from src.backend.tenancy import get_current_tenant
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CulturalConsentContext:
     """Represents cultural/Indigenous data-sovereignty consent for a request.
 
@@ -26,6 +27,12 @@ class CulturalConsentContext:
     reason: Optional[str] = None
 
 
+@lru_cache(maxsize=1024)
+def _default_context(tenant_id: str) -> CulturalConsentContext:
+    # Contexts are frozen, so the no-metadata default can be shared per tenant.
+    return CulturalConsentContext(tenant_id=tenant_id)
+
+
 def evaluate_cultural_ai_consent(
     *,
     tenant_id: Optional[str] = None,
@@ -46,6 +53,8 @@ def evaluate_cultural_ai_consent(
     """
 
     current_tenant = tenant_id or get_current_tenant()
+    if not patient_metadata:
+        return _default_context(current_tenant)
 
     # Default posture: allow cultural AI features, but do *not* allow reuse for
     # model training unless explicitly consented.
@@ -53,18 +62,17 @@ def evaluate_cultural_ai_consent(
     training_allowed = False
     reason: Optional[str] = None
 
-    if patient_metadata is not None:
-        if "consent_cultural_ai" in patient_metadata:
-            value = patient_metadata["consent_cultural_ai"]
-            if isinstance(value, bool):
-                cultural_ai_allowed = value
-            reason = reason or "patient_level_consent"
-
-        if "consent_data_training" in patient_metadata:
-            value = patient_metadata["consent_data_training"]
-            if isinstance(value, bool):
-                training_allowed = value
-            reason = reason or "patient_level_training_consent"
+    if "consent_cultural_ai" in patient_metadata:
+        value = patient_metadata["consent_cultural_ai"]
+        if isinstance(value, bool):
+            cultural_ai_allowed = value
+        reason = reason or "patient_level_consent"
+
+    if "consent_data_training" in patient_metadata:
+        value = patient_metadata["consent_data_training"]
+        if isinstance(value, bool):
+            training_allowed = value
+        reason = reason or "patient_level_training_consent"
 
     return CulturalConsentContext(
         tenant_id=current_tenant,
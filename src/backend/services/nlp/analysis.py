@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, NamedTuple, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.backend.domain.nlp.coding_models import BillingRiskSummary, CodeAssignment
+from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote, TranscriptSegment
+from src.backend.services.nlp.coding_orchestrator import coding_orchestrator
+from src.backend.services.nlp.emotion_classifier import emotion_classifier
+from src.backend.services.nlp.relevance_classifier import relevance_classifier
+from src.backend.services.nlp.service import nlp_service
+
+
+class TranscriptAnalysis(NamedTuple):
+    entities: ClinicalEntities
+    soap_note: SOAPNote
+    codes: List[CodeAssignment]
+    billing_risk: Optional[BillingRiskSummary]
+    segments: List[TranscriptSegment]
+
+
+async def analyze_transcript_text(text: str) -> TranscriptAnalysis:
+    """Run the full analysis used by the session/transcription analyze routes.
+
+    Coding depends on the NER/SOAP output and emotion tagging on the relevance
+    segments, but the two chains are independent of each other, so both run
+    concurrently in the threadpool and the event loop is never blocked.
+    """
+
+    def _entities_and_codes():
+        entities, soap = nlp_service.extract_and_summarize(text)
+        return entities, soap, coding_orchestrator.assign_codes(entities, soap)
+
+    def _segments() -> List[TranscriptSegment]:
+        return emotion_classifier.classify_segments(relevance_classifier.classify_segments(text))
+
+    (entities, soap, (codes, billing_risk)), segments = await asyncio.gather(
+        run_in_threadpool(_entities_and_codes),
+        run_in_threadpool(_segments),
+    )
+    return TranscriptAnalysis(entities, soap, codes, billing_risk, segments)
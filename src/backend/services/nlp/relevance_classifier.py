@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import List
 
 from src.backend.domain.nlp.models import RelevanceLabel, TranscriptSegment, SpeakerRole
@@ -17,8 +18,10 @@ class RelevanceClassifier:
         if not transcript:
             return []
         raw_segments = [s.strip() for s in _split_sentences(transcript) if s.strip()]
+        # Long transcripts produce many segments; the values are known-good so
+        # skip per-segment validation.
         return [
-            TranscriptSegment(
+            TranscriptSegment.model_construct(
                 text=segment,
                 start_ms=None,
                 end_ms=None,
@@ -30,12 +33,12 @@ class RelevanceClassifier:
         ]
 
 
-def _split_sentences(text: str) -> list[str]:
-    # Extremely naive sentence splitter; good enough for demo purposes.
-    import re
+# Extremely naive sentence splitter; good enough for demo purposes.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    return parts
+def _split_sentences(text: str) -> list[str]:
+    return _SENTENCE_BOUNDARY.split(text)
 
 
 relevance_classifier = RelevanceClassifier()
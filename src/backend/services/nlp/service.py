@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Tuple
+import hashlib
+import logging
+from dataclasses import astuple
+from typing import Any, Iterable, Mapping, NamedTuple, Tuple
+
+from src.backend.config import settings
+from src.backend.core.cache import TTLCache
 
 from src.backend.domain.nlp.models import ClinicalEntities, SOAPNote
 from src.backend.services.governance.indigenous_data_sovereignty_guard import (
@@ -23,6 +29,8 @@ from src.backend.services.nlp.indigenous_phrase_normalizer import (
 )
 from src.backend.tenancy import get_current_tenant
 
+logger = logging.getLogger(__name__)
+
 
 class PipelineNLPService:
     """Clinical NLP pipeline orchestrating NER, coding, and SOAP generation.
@@ -36,6 +44,10 @@ class PipelineNLPService:
     normalization, gated by a lightweight consent context. When no explicit
     consent metadata is supplied, behaviour falls back to the previous
     implementation.
+
+    Results are memoized in a small LRU keyed by a digest of the transcript
+    and the evaluated consent context (see ``NLP_CACHE_MAXSIZE``); callers get
+    their own copies so cached results are never mutated.
     """
 
     def __init__(
@@ -48,6 +60,9 @@ class PipelineNLPService:
         self._ner: NERBackend = ner_backend or get_ner_backend_from_env()
         self._coding: CodingBackend = coding_backend or get_coding_backend_from_env()
         self._soap: SOAPGeneratorBackend = soap_backend or get_soap_backend_from_env()
+        self._cache: TTLCache[Tuple[ClinicalEntities, SOAPNote]] | None = None
+        if settings.nlp_cache_maxsize > 0:
+            self._cache = TTLCache(maxsize=settings.nlp_cache_maxsize)
 
     def extract_and_summarize(
         self,
@@ -86,6 +101,19 @@ class PipelineNLPService:
                 patient_metadata=patient_metadata,
             )
 
+        cache_key = None
+        if self._cache is not None:
+            # The consent context fully determines how the text is normalized,
+            # so together with the transcript digest it identifies the result.
+            cache_key = (
+                hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).digest(),
+                astuple(consent_ctx) if consent_ctx is not None else None,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                entities, soap_note = cached
+                return entities.model_copy(deep=True), soap_note.model_copy(deep=True)
+
         text_for_nlp = transcript
         if consent_ctx is None or consent_ctx.cultural_ai_allowed:
             text_for_nlp = cultural_phrase_normalizer.normalize(
@@ -100,8 +128,83 @@ class PipelineNLPService:
         entities = self._ner.extract(text_for_nlp)
         entities = self._coding.code(entities)
         soap_note = self._soap.generate(text_for_nlp, entities)
+        if cache_key is not None:
+            self._cache.set(cache_key, (entities.model_copy(deep=True), soap_note.model_copy(deep=True)))
         return entities, soap_note
 
+    def warmup(self) -> None:
+        """Run a tiny transcript through the pipeline to load lazy models.
+
+        Backends such as Med7/ClinicalBERT load their models on first use;
+        calling this at startup moves that cost out of the first request.
+        Failures are logged and otherwise ignored so a missing optional model
+        never prevents the API from starting.
+        """
+
+        try:
+            self.extract_and_summarize(
+                "Patient reports headache.",
+                tenant_id="default",
+                respect_cultural_consent=False,
+            )
+        except Exception:
+            logger.exception("NLP pipeline warmup failed")
+
+
+class JoinedTranscripts(NamedTuple):
+    text: str
+    # True when MAX_NLP_CHARS cut off part of the input.
+    truncated: bool
+
+
+def join_transcripts(texts: Iterable[str], *, source: str = "transcripts") -> JoinedTranscripts:
+    """Join job transcripts for NLP, stopping at ``MAX_NLP_CHARS``.
+
+    Texts are separated by blank lines. Once the cap is reached the remaining
+    texts are not copied and the last one is truncated, so a multi-hour
+    encounter cannot blow up memory or NLP time. Truncation is logged as a
+    warning naming ``source`` (e.g. ``"encounter <id>"``) and reported via
+    ``truncated`` so callers can surface it. A cap of 0 disables the limit.
+    """
+
+    limit = settings.max_nlp_chars
+    if limit <= 0:
+        return JoinedTranscripts("\n\n".join(texts), False)
+
+    parts: list[str] = []
+    remaining = limit
+    truncated = False
+    dropped = 0
+    iterator = iter(texts)
+    for text in iterator:
+        if parts:
+            if remaining <= 2:
+                truncated = True
+                dropped = len(text)
+                break
+            parts.append("\n\n")
+            remaining -= 2
+        if len(text) > remaining:
+            parts.append(text[:remaining])
+            truncated = True
+            dropped = len(text) - remaining
+            break
+        parts.append(text)
+        remaining -= len(text)
+
+    if not truncated:
+        return JoinedTranscripts("".join(parts), False)
+
+    dropped += sum(len(text) for text in iterator)
+    joined = "".join(parts)
+    logger.warning(
+        "Combined transcript for %s truncated to %d chars (MAX_NLP_CHARS); %d chars dropped",
+        source,
+        len(joined),
+        dropped,
+    )
+    return JoinedTranscripts(joined, True)
+
 
 # Default singleton instance used by API routes.
 nlp_service = PipelineNLPService()
@@ -1,19 +1,47 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
+from src.backend.config import settings
+from src.backend.core.cache import TTLCache, encounter_data_version
 from src.backend.domain.models.patient_timeline import TimelineEvent, TimelineEventType
-from src.backend.infra.db.inmemory import encounter_repository, clinical_note_repository
+# Looked up at call time: init_sql_repositories swaps these on startup.
+from src.backend.infra.db import inmemory as repos
+from src.backend.tenancy import get_current_tenant
 
 
 class PatientSummaryService:
-    """Build a lightweight patient timeline from encounters and notes."""
+    """Build a lightweight patient timeline from encounters and notes.
+
+    Built timelines are cached per ``(tenant, patient_id)`` together with
+    ``encounter_data_version``, so any committed encounter/note write makes the
+    cached copy unreachable; the TTL bounds staleness from other processes.
+    """
+
+    def __init__(self) -> None:
+        self._cache: TTLCache[Tuple[TimelineEvent, ...]] = TTLCache(
+            maxsize=settings.timeline_cache_maxsize,
+            ttl_seconds=settings.timeline_cache_ttl_seconds,
+        )
+
+    def get_timeline(self, patient_id: str) -> List[TimelineEvent]:
+        """Return the patient's timeline, reusing a cached build when valid."""
+
+        key = (get_current_tenant(), patient_id, encounter_data_version.value)
+        events = self._cache.get(key)
+        if events is None:
+            # Cached as a tuple so callers get their own list to mutate.
+            events = tuple(self.build_timeline(patient_id))
+            self._cache.set(key, events)
+        return list(events)
 
     def build_timeline(self, patient_id: str) -> List[TimelineEvent]:
         events: List[TimelineEvent] = []
 
         # Encounters for this patient are already tenant-scoped by repository.
-        for enc in encounter_repository.list_by_filters(patient_id=patient_id):
+        encounters = list(repos.encounter_repository.list_by_filters(patient_id=patient_id))
+        notes = repos.clinical_note_repository.get_by_encounters(enc.id for enc in encounters)
+        for enc in encounters:
             events.append(
                 TimelineEvent(
                     type=TimelineEventType.ENCOUNTER,
@@ -24,7 +52,7 @@ class PatientSummaryService:
                 )
             )
 
-            note = clinical_note_repository.get_by_encounter(enc.id)
+            note = notes.get(enc.id)
             if note is not None:
                 # Very naive extraction of diagnoses/medications from the text; in
                 # a real implementation this would pull from structured NLP
@@ -15,6 +15,9 @@ class InMemoryTemplateService:
 
     def __init__(self) -> None:
         self._templates: Dict[UUID, NoteTemplate] = {}
+        # Per-tenant lists in insertion order so lookups never walk other
+        # tenants' templates.
+        self._by_tenant: Dict[str, List[NoteTemplate]] = {}
         self._seed_defaults()
 
     def _seed_defaults(self) -> None:
@@ -94,7 +97,11 @@ class InMemoryTemplateService:
             ],
             is_default=True,
         )
-        self._templates[template_id] = tmpl
+        self._store(tmpl)
+
+    def _store(self, tmpl: NoteTemplate) -> None:
+        self._templates[tmpl.id] = tmpl
+        self._by_tenant.setdefault(tmpl.tenant_id, []).append(tmpl)
 
     def list_templates(
         self,
@@ -102,11 +109,8 @@ class InMemoryTemplateService:
         specialty: Optional[str] = None,
         visit_type: Optional[str] = None,
     ) -> List[NoteTemplate]:
-        tenant = get_current_tenant()
         results: List[NoteTemplate] = []
-        for tmpl in self._templates.values():
-            if tmpl.tenant_id != tenant:
-                continue
+        for tmpl in self._by_tenant.get(get_current_tenant(), ()):
             if specialty and tmpl.specialty != specialty:
                 continue
             if visit_type and tmpl.visit_type != visit_type:
@@ -133,14 +137,11 @@ class InMemoryTemplateService:
             sections=sections,
             is_default=False,
         )
-        self._templates[template_id] = tmpl
+        self._store(tmpl)
         return tmpl
 
     def get_default_for(self, *, specialty: str, visit_type: Optional[str] = None) -> Optional[NoteTemplate]:
-        tenant = get_current_tenant()
-        for tmpl in self._templates.values():
-            if tmpl.tenant_id != tenant:
-                continue
+        for tmpl in self._by_tenant.get(get_current_tenant(), ()):
             if tmpl.specialty != specialty:
                 continue
             if visit_type is not None and tmpl.visit_type != visit_type:
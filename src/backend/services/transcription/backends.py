@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Optional, Protocol
+import os
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Protocol
 
 from src.backend.config import settings
+from src.backend.core.batching_asr_backend import BatchingASRBackend
 from src.backend.core.multi_accent_asr_backend import MultiAccentASRBackend
 
 
@@ -173,9 +176,22 @@ def get_asr_backend_from_env() -> ASRBackend:
     - ASR_BACKEND=llama → LlamaASRBackend (stub for local/offline models)
     - ASR_BACKEND=multi_accent → MultiAccentASRBackend wrapping the default backend
     - Anything else (or unset) → DemoASRBackend
+
+    When ASR_BATCH_ENABLED=true the selected backend is wrapped in a
+    BatchingASRBackend so all transcriptions run on one batching worker.
     """
 
-    backend_name = settings.asr_backend.lower()
+    backend = _select_asr_backend(settings.asr_backend.lower())
+    if settings.asr_batch_enabled:
+        return BatchingASRBackend(
+            base_backend=backend,
+            max_batch_size=settings.asr_batch_max_size,
+            max_wait_ms=settings.asr_batch_max_wait_ms,
+        )
+    return backend
+
+
+def _select_asr_backend(backend_name: str) -> ASRBackend:
     if backend_name == "whisper":
         return WhisperASRBackend()
     if backend_name == "llama":
@@ -187,6 +203,124 @@ def get_asr_backend_from_env() -> ASRBackend:
     return demo_asr_backend
 
 
+class _WavLayout(NamedTuple):
+    # Complete "fmt " chunk (id, size and body, plus any pad byte).
+    fmt_chunk: bytes
+    # File offset of the first sample byte in the "data" chunk.
+    data_offset: int
+    # Bytes per sample frame; windows start and end on a frame boundary.
+    block_align: int
+
+
+def _read_wav_layout(f: BinaryIO) -> Optional[_WavLayout]:
+    """Locate the ``fmt `` and ``data`` chunks of a RIFF/WAVE stream.
+
+    Other chunks (LIST, fact, ...) are skipped. The ``data`` size field is
+    ignored, since streaming writers leave it at 0 or a placeholder. Returns
+    ``None`` for anything that is not a parseable WAV file.
+    """
+
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+        return None
+
+    fmt_chunk: Optional[bytes] = None
+    block_align = 1
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id = chunk_header[:4]
+        size = int.from_bytes(chunk_header[4:], "little")
+        padded = size + (size & 1)
+        if chunk_id == b"data":
+            if fmt_chunk is None:
+                return None
+            return _WavLayout(fmt_chunk, f.tell(), block_align)
+        if chunk_id == b"fmt ":
+            body = f.read(padded)
+            if len(body) < 16:
+                return None
+            fmt_chunk = chunk_header + body
+            block_align = int.from_bytes(body[12:14], "little") or 1
+        else:
+            f.seek(padded, os.SEEK_CUR)
+
+
+def _wav_window(layout: _WavLayout, samples: bytes) -> bytes:
+    """Return a standalone WAV file holding ``samples`` with ``layout``'s format."""
+
+    pad = b"\x00" if len(samples) & 1 else b""
+    riff_size = 4 + len(layout.fmt_chunk) + 8 + len(samples) + len(pad)
+    return b"".join(
+        (
+            b"RIFF",
+            riff_size.to_bytes(4, "little"),
+            b"WAVE",
+            layout.fmt_chunk,
+            b"data",
+            len(samples).to_bytes(4, "little"),
+            samples,
+            pad,
+        )
+    )
+
+
+def transcribe_range(
+    backend: ASRBackend,
+    audio_url: str,
+    *,
+    start_byte: int,
+    end_byte: Optional[int] = None,
+    language_code: Optional[str] = None,
+) -> str:
+    """Transcribe only the ``[start_byte, end_byte)`` range of a local audio file.
+
+    Backends that support native range/streaming decoding can implement a
+    ``transcribe_range`` method with the same keyword arguments and it will be
+    used directly. Otherwise the range is copied into a sibling window file
+    which is passed to ``backend.transcribe`` and removed afterwards.
+
+    For WAV input the window is clamped to the ``data`` chunk and aligned to
+    whole sample frames (``start_byte`` is rounded down), and it gets a fresh
+    header with the original ``fmt `` chunk and sizes matching the window, so
+    decoders such as ffmpeg (used by Whisper) can read it. Other formats are
+    sliced as raw bytes.
+    """
+
+    native = getattr(backend, "transcribe_range", None)
+    if native is not None:
+        return native(audio_url, start_byte=start_byte, end_byte=end_byte, language_code=language_code)
+
+    source = Path(audio_url)
+    if start_byte == 0 and (end_byte is None or end_byte >= source.stat().st_size):
+        return backend.transcribe(audio_url, language_code=language_code)
+
+    with source.open("rb") as f:
+        layout = _read_wav_layout(f)
+        if layout is None:
+            f.seek(start_byte)
+            window = f.read() if end_byte is None else f.read(max(end_byte - start_byte, 0))
+        else:
+            start = max(start_byte, layout.data_offset)
+            start -= (start - layout.data_offset) % layout.block_align
+            f.seek(start)
+            samples = f.read() if end_byte is None else f.read(max(end_byte - start, 0))
+            # Drop a trailing partial frame (e.g. a chunk boundary mid-sample).
+            samples = samples[: len(samples) - len(samples) % layout.block_align]
+            window = _wav_window(layout, samples)
+
+    window_path = source.with_name(f"{source.stem}.window{source.suffix}")
+    window_path.write_bytes(window)
+    try:
+        return backend.transcribe(str(window_path), language_code=language_code)
+    finally:
+        try:
+            os.remove(window_path)
+        except OSError:
+            pass
+
+
 def get_translation_backend_from_env() -> TranslationBackend:
     """Select a translation backend based on TRANSLATION_BACKEND env var.
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID, uuid4
 
 from src.backend.domain.models.transcription_job import TranscriptJob, TranscriptJobStatus
@@ -94,7 +94,7 @@ class InMemoryTranscriptionService:
         job.status = TranscriptJobStatus.PROCESSING
 
         base_text = self._asr_backend.transcribe(
-            audio_url=str(job.audio_url),
+            audio_url=job.audio_url,
             language_code=job.language_code,
         )
         translated_text = None
@@ -119,6 +119,18 @@ class InMemoryTranscriptionService:
             return None
         return job
 
+    def get_jobs(self, job_ids: Iterable[UUID]) -> List[TranscriptJob]:
+        """Return the visible jobs for ``job_ids``, preserving order.
+
+        Unknown and other-tenant IDs are skipped. Callers that need several
+        jobs should use this rather than calling ``get_job`` in a loop so that
+        persistence-backed implementations can serve them in one round trip.
+        """
+
+        tenant_id = get_current_tenant()
+        jobs = (self._jobs.get(job_id) for job_id in job_ids)
+        return [job for job in jobs if job is not None and job.tenant_id == tenant_id]
+
 
 # Default singleton instance for simple use in routers during early stages.
 transcription_service = InMemoryTranscriptionService()
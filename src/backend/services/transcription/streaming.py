@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from src.backend.config import settings
+from src.backend.services.transcription.backends import ASRBackend, transcribe_range
+
+
+class LiveTranscriptBuffer:
+    """Incremental transcript state for a single live audio stream.
+
+    Re-transcribing the whole buffered file on every chunk makes a stream of N
+    chunks cost O(N^2) audio decoding. Instead we keep a *committed* prefix
+    transcript plus a byte offset into the audio file, and only the audio after
+    that offset (the rolling window) is passed to the ASR backend. Once the
+    window transcript has stayed unchanged for ``commit_after`` consecutive
+    runs it is appended to the committed text and the offset advances past it.
+
+    ASR runs are additionally throttled to at most one every
+    ``min_interval_ms`` so that bursts of small chunks are coalesced.
+    """
+
+    def __init__(
+        self,
+        audio_path: str,
+        *,
+        asr_backend: ASRBackend,
+        language_code: Optional[str] = None,
+        min_interval_ms: Optional[int] = None,
+        commit_after: Optional[int] = None,
+    ) -> None:
+        self._audio_path = audio_path
+        self._asr_backend = asr_backend
+        self._language_code = language_code
+        self._min_interval_s = (
+            settings.ws_asr_min_interval_ms if min_interval_ms is None else min_interval_ms
+        ) / 1000.0
+        self._commit_after = settings.ws_asr_commit_after if commit_after is None else commit_after
+
+        self._committed_offset = 0
+        self._committed_text = ""
+        self._window_text = ""
+        self._stable_runs = 0
+        self._last_run: Optional[float] = None
+
+    @property
+    def text(self) -> str:
+        """Best current transcript: committed prefix plus the latest window."""
+
+        if self._committed_text and self._window_text:
+            return f"{self._committed_text} {self._window_text}"
+        return self._committed_text or self._window_text
+
+    def due(self, total_bytes: int) -> bool:
+        """Return True if :meth:`update` would run ASR for ``total_bytes``.
+
+        Lets callers defer work that only ASR needs (such as flushing buffered
+        audio to disk) until a run will actually happen.
+        """
+
+        if total_bytes <= self._committed_offset:
+            return False
+        return self._last_run is None or time.monotonic() - self._last_run >= self._min_interval_s
+
+    def update(self, total_bytes: int) -> str:
+        """Transcribe newly received audio if the throttle allows it.
+
+        ``total_bytes`` is the number of bytes currently flushed to the audio
+        file. Returns the current best transcript (possibly unchanged when the
+        run was throttled).
+        """
+
+        if not self.due(total_bytes):
+            return self.text
+        self._last_run = time.monotonic()
+
+        window_text = transcribe_range(
+            self._asr_backend,
+            self._audio_path,
+            start_byte=self._committed_offset,
+            end_byte=total_bytes,
+            language_code=self._language_code,
+        ).strip()
+
+        if window_text and window_text == self._window_text:
+            self._stable_runs += 1
+        else:
+            self._stable_runs = 0
+        self._window_text = window_text
+
+        if self._stable_runs >= self._commit_after:
+            self._committed_text = self.text
+            self._committed_offset = total_bytes
+            self._window_text = ""
+            self._stable_runs = 0
+
+        return self.text
@@ -0,0 +1,28 @@
+from httpx import AsyncClient
+from fastapi import status
+
+from src.backend.main import app
+
+
+async def test_clinic_overview_counts_tenant_encounters():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        headers = {"X-Tenant-ID": "tenant-analytics"}
+        for title in ("First", "Second"):
+            resp = await ac.post("/api/v1/encounters/", json={"title": title}, headers=headers)
+            assert resp.status_code == status.HTTP_201_CREATED
+
+        resp = await ac.get("/api/v1/analytics/clinic-overview", headers=headers)
+        assert resp.status_code == status.HTTP_200_OK
+        body = resp.json()
+        assert body["total_encounters"] == 2
+        assert body["total_notes"] == 0
+        assert body["finalized_rate"] is None
+
+        other = await ac.get("/api/v1/analytics/clinic-overview", headers={"X-Tenant-ID": "tenant-analytics-other"})
+        assert other.json()["total_encounters"] == 0
+
+        resp = await ac.post("/api/v1/encounters/", json={"title": "Third"}, headers=headers)
+        assert resp.status_code == status.HTTP_201_CREATED
+        # Cached aggregates are invalidated by the write.
+        resp = await ac.get("/api/v1/analytics/clinic-overview", headers=headers)
+        assert resp.json()["total_encounters"] == 3
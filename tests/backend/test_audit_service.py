@@ -0,0 +1,63 @@
+import json
+import logging
+import queue
+
+from src.backend.services.audit.service import AuditService
+from src.backend.services.blockchain.multichain import MultiChainClient, MultiChainConfig
+
+
+def test_batched_audit_events_are_flushed_on_stop(caplog):
+    service = AuditService()
+    service.start()
+    with caplog.at_level(logging.INFO, logger="audit"):
+        for i in range(5):
+            service.log_event(action="create", resource_type="encounter", resource_id=str(i))
+        service.stop()
+
+    logged = [json.loads(r.getMessage()) for r in caplog.records if r.name == "audit"]
+    assert [e["resource_id"] for e in logged] == ["0", "1", "2", "3", "4"]
+
+
+def test_audit_events_are_written_inline_when_queue_is_full(caplog):
+    service = AuditService()
+    # Simulate a stalled flusher with a full queue.
+    service._queue = queue.Queue(maxsize=1)
+    service._queue.put_nowait(object())
+    with caplog.at_level(logging.INFO, logger="audit"):
+        service.log_event(action="create", resource_type="encounter", resource_id="overflow")
+
+    logged = [json.loads(r.getMessage()) for r in caplog.records if r.name == "audit"]
+    assert [e["resource_id"] for e in logged] == ["overflow"]
+
+
+def test_multichain_batch_uses_publishmulti_when_supported():
+    config = MultiChainConfig(
+        enabled=True,
+        scheme="http",
+        host="127.0.0.1",
+        port=1,
+        rpc_user="u",
+        rpc_password="p",
+        chain_name=None,
+        audit_stream="audit",
+        timeout_seconds=1.0,
+    )
+    calls = []
+
+    def fake_rpc(method, params):
+        calls.append((method, params))
+        return {"version": "2.3.3"} if method == "getinfo" else "txid"
+
+    client = MultiChainClient(config)
+    client._rpc = fake_rpc
+    client.publish_audit_events([{"resource_type": "encounter"}, {"resource_type": None}])
+
+    assert [m for m, _ in calls] == ["getinfo", "publishmulti"]
+    stream, items = calls[1][1]
+    assert stream == "audit"
+    assert [i["key"] for i in items] == ["encounter", "audit"]
+
+    calls.clear()
+    client._supports_publishmulti = False
+    client.publish_audit_events([{"resource_type": "a"}, {"resource_type": "b"}])
+    assert [m for m, _ in calls] == ["publish", "publish"]
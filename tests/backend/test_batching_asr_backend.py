@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.backend.core.batching_asr_backend import BatchingASRBackend
+
+
+class _BatchBackend:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def transcribe(self, audio_url, language_code=None):
+        self.batch_sizes.append(1)
+        return f"text:{audio_url}"
+
+    def transcribe_batch(self, requests):
+        self.batch_sizes.append(len(requests))
+        return [f"text:{audio_url}" for audio_url, _ in requests]
+
+
+def test_concurrent_transcriptions_are_batched_and_routed_back():
+    base = _BatchBackend()
+    backend = BatchingASRBackend(base_backend=base, max_batch_size=4, max_wait_ms=200)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(backend.transcribe, ["a", "b", "c", "d"]))
+
+    assert results == ["text:a", "text:b", "text:c", "text:d"]
+    assert sum(base.batch_sizes) == 4
+    assert len(base.batch_sizes) < 4
+
+
+def test_short_batch_result_fails_every_caller_instead_of_hanging():
+    class _ShortBatchBackend(_BatchBackend):
+        def transcribe_batch(self, requests):
+            return super().transcribe_batch(requests)[:-1]
+
+    backend = BatchingASRBackend(base_backend=_ShortBatchBackend(), max_batch_size=2, max_wait_ms=500)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(backend.transcribe, url) for url in ("a", "b")]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=5)
@@ -0,0 +1,63 @@
+import io
+import wave
+
+from src.backend.services.transcription.backends import transcribe_range
+from src.backend.services.transcription.streaming import LiveTranscriptBuffer
+
+
+class _RecordingBackend:
+    def __init__(self):
+        self.ranges = []
+
+    def transcribe_range(self, audio_url, *, start_byte, end_byte=None, language_code=None):
+        self.ranges.append((start_byte, end_byte))
+        return "hello"
+
+
+def test_live_transcript_buffer_only_transcribes_uncommitted_tail():
+    backend = _RecordingBackend()
+    buffer = LiveTranscriptBuffer("unused.wav", asr_backend=backend, min_interval_ms=0, commit_after=1)
+
+    assert buffer.update(10) == "hello"
+    assert buffer.update(20) == "hello"  # second identical window commits
+    assert buffer.update(30) == "hello hello"
+
+    assert backend.ranges == [(0, 10), (0, 20), (20, 30)]
+
+
+def _wav_with_list_chunk(frames: bytes) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(frames)
+    raw = buf.getvalue()
+    # Insert a LIST chunk between "fmt " and "data" so the header is not the
+    # canonical 44 bytes.
+    list_chunk = b"LIST" + (6).to_bytes(4, "little") + b"INFOab"
+    raw = raw[:36] + list_chunk + raw[36:]
+    return b"RIFF" + (len(raw) - 8).to_bytes(4, "little") + raw[8:]
+
+
+def test_transcribe_range_writes_a_valid_frame_aligned_wav_window(tmp_path):
+    frames = bytes(range(256)) * 4  # 256 stereo 16-bit frames of 4 bytes
+    path = tmp_path / "live.wav"
+    path.write_bytes(_wav_with_list_chunk(frames))
+    data_offset = 36 + 14 + 8
+
+    class _WaveReadingBackend:
+        def transcribe(self, audio_url, language_code=None):
+            with wave.open(audio_url, "rb") as w:
+                self.params = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+                self.frames = w.readframes(w.getnframes())
+            return "ok"
+
+    backend = _WaveReadingBackend()
+    # Unaligned start and end, as produced by arbitrary chunk boundaries.
+    start, end = data_offset + 4 * 10 + 3, data_offset + 4 * 20 + 2
+    assert transcribe_range(backend, str(path), start_byte=start, end_byte=end) == "ok"
+
+    assert backend.params == (2, 2, 8000)
+    assert backend.frames == frames[4 * 10 : 4 * 20]
+    assert not (tmp_path / "live.window.wav").exists()
@@ -1,7 +1,12 @@
+import dataclasses
+
 from httpx import AsyncClient
 from fastapi import status
 
 from src.backend.main import app
+from src.backend.services.nlp import service as nlp_service
+from src.backend.services.nlp.backends import DemoSOAPGeneratorBackend
+from src.backend.services.nlp.service import PipelineNLPService
 
 
 async def test_nlp_analyze_returns_entities_and_soap_note():
@@ -24,3 +29,38 @@ async def test_nlp_analyze_returns_entities_and_soap_note():
 
     soap = data["soap_note"]
     assert "Subjective summary" in soap["subjective"]["text"]
+
+
+def test_pipeline_results_are_cached_per_transcript_and_copied():
+    calls = []
+
+    class CountingSOAPBackend(DemoSOAPGeneratorBackend):
+        def generate(self, text, entities):
+            calls.append(text)
+            return super().generate(text, entities)
+
+    service = PipelineNLPService(soap_backend=CountingSOAPBackend())
+
+    text = "The patient has diabetes and takes metformin."
+    first_entities, first_soap = service.extract_and_summarize(text, tenant_id="t1")
+    second_entities, second_soap = service.extract_and_summarize(text, tenant_id="t1")
+    assert len(calls) == 1
+    assert second_entities == first_entities and second_soap == first_soap
+    assert second_soap is not first_soap
+
+    # A different consent context is a different cache entry.
+    service.extract_and_summarize(text, tenant_id="t1", patient_metadata={"consent_cultural_ai": False})
+    assert len(calls) == 2
+
+
+def test_join_transcripts_reports_truncation(monkeypatch, caplog):
+    monkeypatch.setattr(nlp_service, "settings", dataclasses.replace(nlp_service.settings, max_nlp_chars=10))
+    join_transcripts = nlp_service.join_transcripts
+
+    assert join_transcripts(["abc", "def"]) == ("abc\n\ndef", False)
+
+    with caplog.at_level("WARNING"):
+        joined = join_transcripts(["abcdef", "ghijkl", "mn"], source="encounter x")
+    assert joined == ("abcdef\n\ngh", True)
+    assert "encounter x" in caplog.text
+    assert "6 chars dropped" in caplog.text
@@ -0,0 +1,139 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.backend.domain.models.clinical_encounter import ClinicalEncounter, EncounterStatus
+from src.backend.domain.models.clinical_note import ClinicalNote, ClinicalNoteSection
+from src.backend.infra.db.cached import CachedClinicalNoteRepository, CachedEncounterRepository
+from src.backend.infra.db.repositories import ClinicalNoteRepository, EncounterRepository
+from src.backend.infra.db.session import after_commit, set_default_session_factory, unit_of_work
+from src.backend.services.patients.summary_service import PatientSummaryService
+
+
+class _CountingRepository(EncounterRepository):
+    def __init__(self):
+        self.rows = {}
+        self.gets = 0
+
+    def get(self, encounter_id):
+        self.gets += 1
+        row = self.rows.get(encounter_id)
+        return row.model_copy(deep=True) if row else None
+
+    def list_by_filters(self, *, clinician_id=None, patient_id=None, status=None):
+        return list(self.rows.values())
+
+    def save(self, encounter):
+        self.rows[encounter.id] = encounter.model_copy(deep=True)
+
+
+def test_cached_encounter_repository_reads_through_and_invalidates_on_save():
+    inner = _CountingRepository()
+    repo = CachedEncounterRepository(inner, maxsize=16, ttl_seconds=60)
+    encounter = ClinicalEncounter(
+        id=uuid4(),
+        created_at=datetime.utcnow(),
+        status=EncounterStatus.CREATED,
+        tenant_id="default",
+    )
+    repo.save(encounter)
+
+    first = repo.get(encounter.id)
+    first.status = EncounterStatus.FINALIZED  # unsaved mutation must not leak
+    assert repo.get(encounter.id).status == EncounterStatus.CREATED
+    assert inner.gets == 1
+
+    repo.save(first)
+    assert repo.get(encounter.id).status == EncounterStatus.FINALIZED
+    assert inner.gets == 2
+
+
+def test_cached_note_repository_bulk_lookup_only_loads_misses():
+    class _Notes(ClinicalNoteRepository):
+        def __init__(self):
+            self.by_encounter = {}
+            self.bulk_calls = []
+
+        def get(self, note_id):
+            return None
+
+        def get_by_encounter(self, encounter_id):
+            return self.by_encounter.get(encounter_id)
+
+        def get_by_encounters(self, encounter_ids):
+            ids = list(encounter_ids)
+            self.bulk_calls.append(ids)
+            return {eid: self.by_encounter[eid] for eid in ids if eid in self.by_encounter}
+
+        def encounter_ids_with_notes(self):
+            return set(self.by_encounter)
+
+        def save(self, note):
+            self.by_encounter[note.encounter_id] = note
+
+    inner = _Notes()
+    with_note, without_note = uuid4(), uuid4()
+    now = datetime.utcnow()
+    inner.save(
+        ClinicalNote(
+            id=uuid4(),
+            encounter_id=with_note,
+            created_at=now,
+            updated_at=now,
+            subjective=ClinicalNoteSection(text="s"),
+            objective=ClinicalNoteSection(text="o"),
+            assessment=ClinicalNoteSection(text="a"),
+            plan=ClinicalNoteSection(text="p"),
+            tenant_id="default",
+        )
+    )
+    repo = CachedClinicalNoteRepository(inner, maxsize=16, ttl_seconds=60)
+
+    assert set(repo.get_by_encounters([with_note, without_note])) == {with_note}
+    assert set(repo.get_by_encounters([with_note, without_note])) == {with_note}
+    # The found note is served from the cache; the miss is asked for again.
+    assert inner.bulk_calls == [[with_note, without_note], [without_note]]
+
+
+def test_after_commit_callbacks_wait_for_the_unit_of_work():
+    class _Session:
+        def __init__(self):
+            self.committed = False
+
+        def commit(self):
+            self.committed = True
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    fired = []
+    after_commit(lambda: fired.append("immediate"))
+    assert fired == ["immediate"]
+
+    set_default_session_factory(_Session)
+    try:
+        with unit_of_work() as session:
+            after_commit(lambda: fired.append(session.committed))
+            assert fired == ["immediate"]
+        assert fired == ["immediate", True]
+
+        with pytest.raises(RuntimeError):
+            with unit_of_work():
+                after_commit(lambda: fired.append("rolled back"))
+                raise RuntimeError
+        assert fired == ["immediate", True]
+    finally:
+        set_default_session_factory(None)
+
+
+def test_cached_timeline_is_not_shared_with_callers():
+    service = PatientSummaryService()
+    service.build_timeline = lambda patient_id: []
+
+    service.get_timeline("p1").append("mutated")
+
+    assert service.get_timeline("p1") == []
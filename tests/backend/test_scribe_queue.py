@@ -0,0 +1,38 @@
+import json
+
+from httpx import AsyncClient
+from fastapi import status
+
+from src.backend.infra.db import inmemory as repos
+from src.backend.main import app
+from src.backend.services.encounters.service import encounter_service
+
+
+async def test_scribe_queue_stream_matches_list_and_is_tenant_scoped():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        headers = {"X-Tenant-ID": "tenant-scribe-stream"}
+        for title in ("First", "Second"):
+            resp = await ac.post("/api/v1/encounters/", json={"title": title}, headers=headers)
+            assert resp.status_code == status.HTTP_201_CREATED
+
+        listed = await ac.get("/api/v1/scribe/queue", headers=headers)
+        assert listed.status_code == status.HTTP_200_OK
+
+        streamed = await ac.get("/api/v1/scribe/queue/stream", headers=headers)
+        assert streamed.status_code == status.HTTP_200_OK
+        assert streamed.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = [json.loads(line) for line in streamed.text.splitlines()]
+        assert rows == listed.json()
+        assert sorted(r["title"] for r in rows) == ["First", "Second"]
+
+        other = await ac.get("/api/v1/scribe/queue/stream", headers={"X-Tenant-ID": "tenant-scribe-other"})
+        assert other.text == ""
+
+
+def test_encounter_listing_survives_concurrent_creates():
+    encounter_service.create_encounter(title="Existing")
+    rows = iter(repos.encounter_repository.list_by_filters())
+    next(rows)
+    encounter_service.create_encounter(title="Created mid-stream")
+    list(rows)  # must not raise "dictionary changed size during iteration"
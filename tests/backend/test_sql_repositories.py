@@ -0,0 +1,93 @@
+import dataclasses
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from src.backend.infra.db import bootstrap
+from src.backend.infra.db import inmemory as repos
+from src.backend.infra.db import session as db_session
+from src.backend.infra.db.cached import CachedEncounterRepository
+from src.backend.main import app
+
+
+@pytest.fixture
+def sql_repositories(tmp_path, monkeypatch):
+    """Run init_sql_repositories against a throwaway SQLite database."""
+
+    # Register the current singletons so monkeypatch restores them afterwards.
+    for name in ("encounter_repository", "clinical_note_repository", "transcription_job_repository", "analytics_repository"):
+        monkeypatch.setattr(repos, name, getattr(repos, name))
+    monkeypatch.setattr(db_session, "_default_session_factory", db_session._default_session_factory)
+    monkeypatch.setattr(
+        bootstrap,
+        "settings",
+        dataclasses.replace(
+            bootstrap.settings,
+            use_sql_repos=True,
+            database_url=f"sqlite:///{tmp_path / 'repos.db'}",
+            repo_cache_ttl_seconds=60,
+        ),
+    )
+    bootstrap.init_sql_repositories()
+
+
+async def test_encounter_reads_go_through_the_repository_cache(sql_repositories, monkeypatch):
+    assert isinstance(repos.encounter_repository, CachedEncounterRepository)
+    inner = repos.encounter_repository._inner
+    inner_get = inner.get
+    calls = []
+
+    def counting_get(encounter_id):
+        calls.append(encounter_id)
+        return inner_get(encounter_id)
+
+    monkeypatch.setattr(inner, "get", counting_get)
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        created = await ac.post("/api/v1/encounters/", json={"title": "Cached"})
+        assert created.status_code == status.HTTP_201_CREATED
+        encounter_id = created.json()["id"]
+
+        for _ in range(2):
+            resp = await ac.get(f"/api/v1/encounters/{encounter_id}")
+            assert resp.status_code == status.HTTP_200_OK
+            assert resp.json()["encounter"]["title"] == "Cached"
+
+    assert len(calls) == 1
+
+
+async def test_note_update_commits_encounter_and_note_once_on_one_session(sql_repositories, monkeypatch):
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        created = await ac.post("/api/v1/encounters/", json={"title": "Unit of work"})
+        encounter_id = created.json()["id"]
+
+        uow_sessions = []
+        factory = db_session._default_session_factory
+
+        def recording_factory():
+            session = factory()
+            uow_sessions.append(session)
+            return session
+
+        committed = []
+        session_commit = Session.commit
+
+        def recording_commit(self):
+            committed.append(self)
+            return session_commit(self)
+
+        monkeypatch.setattr(db_session, "_default_session_factory", recording_factory)
+        monkeypatch.setattr(Session, "commit", recording_commit)
+
+        resp = await ac.put(
+            f"/api/v1/encounters/{encounter_id}/note",
+            json={"subjective": "s", "objective": "o", "assessment": "a", "plan": "p"},
+        )
+        assert resp.status_code == status.HTTP_200_OK
+
+    assert len(uow_sessions) == 1
+    assert committed == uow_sessions
+    assert repos.clinical_note_repository.get_by_encounter(UUID(encounter_id)).plan.text == "p"